@@ -0,0 +1,154 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from convolution import MODES, choose_method, next_fast_len, trim
+
+ROW_BLOCK_BYTES = 64 * 2 ** 20      # bir blokta işlenecek ara sonuçların üst sınırı
+POOL_MIN_WORK = 2 ** 26             # bu işlem sayısının altında süreç havuzu açılmaz
+
+_shared = {}
+
+
+class KernelBank:
+    """Çekirdek yığını; FFT'leri verilen uzunluk için bir kez hesaplanır."""
+
+    def __init__(self, h):
+        h = np.asarray(h, dtype=float)
+        self.single = h.ndim == 1
+        self.h = np.atleast_2d(h)
+        if self.h.ndim != 2 or self.h.shape[1] == 0:
+            raise ValueError("h tek boyutlu dizi ya da (K, M) yığını olmalı")
+        self._spectra = {}
+
+    @property
+    def count(self):
+        return self.h.shape[0]
+
+    @property
+    def length(self):
+        return self.h.shape[1]
+
+    def spectrum(self, nfft):
+        if nfft not in self._spectra:
+            self._spectra[nfft] = np.fft.rfft(self.h, nfft, axis=-1)
+        return self._spectra[nfft]
+
+
+def _rows_per_block(n_rows, n_kernels, len_y):
+    per_row = max(1, n_kernels * len_y * 16)
+    # Boş aralıkta bile adım en az 1 olmalı (range(..., 0) hata verir)
+    return int(max(1, min(n_rows, ROW_BLOCK_BYTES // per_row)))
+
+
+def _convolve_rows(x, h, H, nfft, out):
+    # x: (r, N), h: (K, M), out: (r, K, N+M-1)
+    if H is None:
+        out[...] = 0
+        for k in range(h.shape[1]):
+            out[:, :, k:k + x.shape[1]] += h[None, :, k, None] * x[:, None, :]
+    else:
+        X = np.fft.rfft(x, nfft, axis=-1)
+        out[...] = np.fft.irfft(X[:, None, :] * H[None, :, :], nfft, axis=-1)[..., :out.shape[-1]]
+
+
+def _convolve_range(x, h, H, nfft, out, start, stop):
+    step = _rows_per_block(stop - start, h.shape[0], out.shape[-1])
+    for r in range(start, stop, step):
+        e = min(r + step, stop)
+        _convolve_rows(x[r:e], h, H, nfft, out[r:e])
+
+
+def _attach(name, shape, dtype):
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _init_worker(specs, nfft):
+    for key, (name, shape, dtype) in specs.items():
+        _shared[key] = _attach(name, shape, dtype)
+    _shared["nfft"] = nfft
+
+
+def _worker(start, stop):
+    x = _shared["x"][1]
+    h = _shared["h"][1]
+    H = _shared["H"][1] if "H" in _shared else None
+    out = _shared["out"][1]
+    _convolve_range(x, h, H, _shared["nfft"], out, start, stop)
+    return stop - start
+
+
+def _to_shared(arr, blocks):
+    shm = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+    blocks.append(shm)
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[...] = arr
+    return shm.name, arr.shape, arr.dtype
+
+
+def _run_pool(x, bank, H, nfft, len_y, jobs):
+    blocks = []
+    try:
+        specs = {"x": _to_shared(x, blocks), "h": _to_shared(bank.h, blocks)}
+        if H is not None:
+            specs["H"] = _to_shared(H, blocks)
+        out_shape = (x.shape[0], bank.count, len_y)
+        out_shm = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(out_shape)) * 8))
+        blocks.append(out_shm)
+        specs["out"] = (out_shm.name, out_shape, np.float64)
+
+        # İşçiler sonucu doğrudan paylaşılan çıkışa yazar, geri pickle edilen veri yok
+        # Satır sayısı parça sayısından azsa linspace tekrar eden sınırlar (boş aralıklar) üretir
+        bounds = np.unique(np.linspace(0, x.shape[0], jobs * 4 + 1).astype(int))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(specs, nfft)) as pool:
+            list(pool.map(_worker, bounds[:-1], bounds[1:]))
+
+        return np.ndarray(out_shape, dtype=np.float64, buffer=out_shm.buf).copy()
+    finally:
+        for shm in blocks:
+            shm.close()
+            shm.unlink()
+
+
+def batch_convolve(x, h, mode="full", method="auto", jobs=None):
+    """
+    (R, N) sinyal yığınını tek çekirdek (M,) veya çekirdek yığını (K, M) ile konvolüsyona sokar.
+    Çıktı tek çekirdekte (R, L), yığında (R, K, L) boyutludur.
+    jobs > 1 ve iş büyükse satırlar paylaşılan bellekli bir süreç havuzuna dağıtılır.
+    """
+    x = np.ascontiguousarray(x, dtype=float)
+    if x.ndim == 1:
+        x = x[None, :]
+    if x.ndim != 2 or x.shape[1] == 0:
+        raise ValueError("x (R, N) boyutlu sinyal yığını olmalı")
+    if mode not in MODES:
+        raise ValueError(f"Desteklenmeyen mod: {mode!r}. {MODES} kullanın.")
+    bank = h if isinstance(h, KernelBank) else KernelBank(h)
+
+    n, m = x.shape[1], bank.length
+    len_y = n + m - 1
+    if method == "auto":
+        method = "direct" if choose_method(n, m) == "direct" else "fft"
+    if method == "direct":
+        H, nfft = None, None
+    elif method == "fft":
+        nfft = next_fast_len(len_y)
+        H = bank.spectrum(nfft)
+    else:
+        raise ValueError(f"Desteklenmeyen yöntem: {method!r}. 'auto', 'direct' veya 'fft' kullanın.")
+
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    work = x.shape[0] * bank.count * len_y * (m if H is None else np.log2(max(nfft, 2)))
+    if jobs > 1 and x.shape[0] > 1 and work >= POOL_MIN_WORK:
+        y = _run_pool(x, bank, H, nfft, len_y, min(jobs, x.shape[0]))
+    else:
+        y = np.empty((x.shape[0], bank.count, len_y))
+        _convolve_range(x, bank.h, H, nfft, y, 0, x.shape[0])
+
+    y = trim(y, n, m, mode)
+    return y[:, 0, :] if bank.single else y
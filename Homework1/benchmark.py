@@ -0,0 +1,61 @@
+"""
+Konvolüsyon yöntemleri arasındaki kesişim noktalarını ölçer.
+
+Kullanım
+-------
+$ python benchmark.py                 # varsayılan boyutlar
+$ python benchmark.py --repeat 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from convolution import convolve
+
+SIGNAL_SIZES = [2 ** p for p in range(8, 21, 2)]
+KERNEL_SIZES = [4, 8, 16, 32, 64, 128, 256, 1024, 4096]
+METHODS = ["direct", "fft", "oa"]
+DIRECT_MAX_WORK = 2 ** 28       # bu işlem sayısının üstünde doğrudan yöntem ölçülmez
+
+
+def best_time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    p = argparse.ArgumentParser(description="Konvolüsyon yöntemleri benchmark")
+    p.add_argument("--repeat", type=int, default=3, help="Her ölçüm için tekrar sayısı")
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'len(x)':>9} {'len(h)':>7} " + " ".join(f"{m:>10}" for m in METHODS) + "   en hızlı  auto")
+    for n in SIGNAL_SIZES:
+        x = rng.standard_normal(n)
+        prev = None
+        for m in KERNEL_SIZES:
+            if m > n:
+                break
+            h = rng.standard_normal(m)
+            times = {}
+            for method in METHODS:
+                if method == "direct" and n * m > DIRECT_MAX_WORK:
+                    continue
+                times[method] = best_time(lambda: convolve(x, h, method=method), args.repeat)
+            fastest = min(times, key=times.get)
+            auto = best_time(lambda: convolve(x, h), args.repeat)
+            cells = " ".join(f"{times[mt] * 1e3:9.3f}ms" if mt in times else f"{'-':>11}" for mt in METHODS)
+            marker = "  <-- kesişim" if prev is not None and prev != fastest else ""
+            print(f"{n:>9} {m:>7} {cells}   {fastest:>8} {auto * 1e3:7.3f}ms{marker}")
+            prev = fastest
+
+
+if __name__ == "__main__":
+    main()
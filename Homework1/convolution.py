@@ -0,0 +1,115 @@
+import numpy as np
+
+MODES = ("full", "same", "valid")
+METHODS = ("auto", "direct", "fft", "oa")
+
+# Yöntem seçimi için eşikler (benchmark.py ile ölçülen kesişim noktaları)
+DIRECT_MAX_KERNEL = 32          # kısa dizi bu boydan küçükse doğrudan toplam
+DIRECT_MAX_WORK = 2 ** 12       # len(x) * len(h) bu değerin altındaysa doğrudan toplam
+OA_MIN_RATIO = 16               # uzun/kısa oranı bunu geçerse overlap-add
+
+
+def next_fast_len(n):
+    # FFT için n'den büyük/eşit en küçük 2, 3, 5 çarpanlı uzunluk
+    if n <= 6:
+        return max(n, 1)
+    best = 1 << (n - 1).bit_length()
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            q = -(-n // p35)
+            q = 1 << (q - 1).bit_length()
+            cand = q * p35
+            if cand < best:
+                best = cand
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def oa_block_size(m):
+    # Blok boyu sadece çekirdek boyuna bağlı; böylece akış modu aynı blokları görür
+    nfft = next_fast_len(8 * m)
+    return nfft - m + 1, nfft
+
+
+def choose_method(n, m):
+    short, long_ = min(n, m), max(n, m)
+    if short <= DIRECT_MAX_KERNEL or n * m <= DIRECT_MAX_WORK:
+        return "direct"
+    if long_ >= OA_MIN_RATIO * short:
+        return "oa"
+    return "fft"
+
+
+def direct_full(x, h):
+    # Kısa dizi üzerinde döngü, uzun dizi üzerinde vektörel toplama
+    if len(x) < len(h):
+        x, h = h, x
+    y = np.zeros(len(x) + len(h) - 1, dtype=np.result_type(x, h, float))
+    for k in range(len(h)):
+        y[k:k + len(x)] += h[k] * x
+    return y
+
+
+def fft_full(x, h):
+    len_y = len(x) + len(h) - 1
+    nfft = next_fast_len(len_y)
+    Y = np.fft.rfft(x, nfft) * np.fft.rfft(h, nfft)
+    return np.fft.irfft(Y, nfft)[:len_y]
+
+
+def oa_full(x, h, block=None):
+    # Overlap-add: x bloklara bölünür, çekirdeğin FFT'si bir kez alınır
+    if len(x) < len(h):
+        x, h = h, x
+    m = len(h)
+    if block is None:
+        block, nfft = oa_block_size(m)
+    else:
+        nfft = next_fast_len(block + m - 1)
+    H = np.fft.rfft(h, nfft)
+    y = np.zeros(len(x) + m - 1)
+    for start in range(0, len(x), block):
+        seg = x[start:start + block]
+        out = np.fft.irfft(np.fft.rfft(seg, nfft) * H, nfft)[:len(seg) + m - 1]
+        y[start:start + len(out)] += out
+    return y
+
+
+def trim(y, n, m, mode):
+    # np.convolve ile aynı 'same' / 'valid' kesimleri
+    if mode == "full":
+        return y
+    short, long_ = min(n, m), max(n, m)
+    if mode == "same":
+        start = (short - 1) // 2
+        return y[..., start:start + long_]
+    if mode == "valid":
+        return y[..., short - 1:long_]
+    raise ValueError(f"Desteklenmeyen mod: {mode!r}. {MODES} kullanın.")
+
+
+def convolve(x, h, mode="full", method="auto"):
+    x = np.asarray(x, dtype=float)
+    h = np.asarray(h, dtype=float)
+    if x.ndim != 1 or h.ndim != 1:
+        raise ValueError("x ve h tek boyutlu dizi olmalı")
+    if len(x) == 0 or len(h) == 0:
+        raise ValueError("x ve h boş olamaz")
+    if mode not in MODES:
+        raise ValueError(f"Desteklenmeyen mod: {mode!r}. {MODES} kullanın.")
+
+    if method == "auto":
+        method = choose_method(len(x), len(h))
+    if method == "direct":
+        y = direct_full(x, h)
+    elif method == "fft":
+        y = fft_full(x, h)
+    elif method == "oa":
+        y = oa_full(x, h)
+    else:
+        raise ValueError(f"Desteklenmeyen yöntem: {method!r}. {METHODS} kullanın.")
+
+    return trim(y, len(x), len(h), mode)
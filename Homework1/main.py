@@ -1,12 +1,14 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from convolution import convolve
+
 def find_low_and_high(k_array):
     low = np.min(k_array)
     high = np.max(k_array)
     return low, high
     
-def my_convolution(x_n, h_n):
+def my_convolution(x_n, h_n, mode='full', method='auto'):
 
     x_low, x_high = find_low_and_high(x_n)
     h_low, h_high = find_low_and_high(h_n)
@@ -18,16 +20,8 @@ def my_convolution(x_n, h_n):
     print("h[n] dizisi aralığı: ", h_low, " ile ", h_high)
     print("y[n] dizisi aralığı: ", y_low, " ile ", y_high)
 
-    len_y = len(x_n) + len(h_n) - 1
-    y = np.zeros(len_y)
-    
-    # Convolution işlemi 
-    for n in range(len_y):
-        for k in range(len(x_n)):
-            if 0 <= n - k < len(h_n):
-                y[n] += x_n[k] * h_n[n - k]
-    
-    return y
+    # Convolution işlemi: giriş boylarına göre doğrudan, FFT veya overlap-add
+    return convolve(x_n, h_n, mode=mode, method=method)
 
 def draw_plot(location, input, title):
     plt.subplot(location)
@@ -0,0 +1,106 @@
+import numpy as np
+
+from convolution import DIRECT_MAX_KERNEL, oa_block_size
+
+DIRECT_BLOCK = 2 ** 16          # doğrudan yöntemde bir çıkış bloğunun en fazla boyu
+
+
+def iter_chunks(x, size):
+    # Dizi veya np.memmap üzerinde kopyasız parça görünümleri
+    for start in range(0, len(x), size):
+        yield x[start:start + size]
+
+
+class StreamingConvolver:
+    """
+    Durumlu, parça parça konvolüsyon. Parçalar arasında çekirdek boyu kadar kuyruk tutulur;
+    üretilen bloklar birleştirildiğinde convolve(x, h, method=method) ile bit düzeyinde aynıdır
+    (len(x) >= len(h) için).
+
+    method açıkça verilmelidir ("direct" veya "oa"): convolve'un "auto" seçimi len(x)'e bağlıdır
+    ve tüm sinyali tek FFT ile işleyen "fft" yolunu seçebilir; akışta len(x) bilinmediğinden
+    aynı seçim yapılamaz ve sonuç yalnızca yuvarlama düzeyinde eşit olurdu.
+    """
+
+    def __init__(self, h, method):
+        self.h = np.asarray(h, dtype=float)
+        if self.h.ndim != 1 or len(self.h) == 0:
+            raise ValueError("h boş olmayan tek boyutlu dizi olmalı")
+        m = len(self.h)
+        if method not in ("direct", "oa"):
+            raise ValueError(f"Desteklenmeyen yöntem: {method!r}. 'direct' veya 'oa' kullanın "
+                             f"(kısa çekirdekte, len(h) <= {DIRECT_MAX_KERNEL}, 'direct' daha hızlıdır).")
+        self.method = method
+        if method == "oa":
+            self.block, self.nfft = oa_block_size(m)
+            self._H = np.fft.rfft(self.h, self.nfft)
+        else:
+            self.block, self.nfft = DIRECT_BLOCK, None
+        self.reset()
+
+    def reset(self):
+        m = len(self.h)
+        self._history = np.zeros(m - 1)     # doğrudan yöntem: son m-1 giriş örneği
+        self._tail = np.zeros(m - 1)        # overlap-add: bir sonraki bloğa taşan çıkış
+        self._pending = np.empty(self.block)
+        self._n_pending = 0
+
+    def _direct_block(self, ext, count):
+        m = len(self.h)
+        out = np.zeros(count)
+        for k in range(m):
+            out += self.h[k] * ext[m - 1 - k:m - 1 - k + count]
+        return out
+
+    def _feed_direct(self, chunk):
+        m = len(self.h)
+        for start in range(0, len(chunk), self.block):
+            seg = chunk[start:start + self.block]
+            ext = np.concatenate((self._history, seg))
+            yield self._direct_block(ext, len(seg))
+            self._history = ext[len(ext) - (m - 1):]
+
+    def _oa_block(self, seg):
+        m = len(self.h)
+        out = np.fft.irfft(np.fft.rfft(seg, self.nfft) * self._H, self.nfft)[:len(seg) + m - 1]
+        out[:m - 1] = self._tail + out[:m - 1]
+        self._tail = out[len(seg):].copy()
+        return out[:len(seg)]
+
+    def _feed_oa(self, chunk):
+        pos = 0
+        while pos < len(chunk):
+            take = min(self.block - self._n_pending, len(chunk) - pos)
+            self._pending[self._n_pending:self._n_pending + take] = chunk[pos:pos + take]
+            self._n_pending += take
+            pos += take
+            if self._n_pending == self.block:
+                self._n_pending = 0
+                yield self._oa_block(self._pending)
+
+    def feed(self, chunk):
+        """Yeni bir giriş parçası verir; kesinleşen çıkış bloklarını üretir."""
+        chunk = np.asarray(chunk, dtype=float).ravel()
+        if self.method == "direct":
+            yield from self._feed_direct(chunk)
+        else:
+            yield from self._feed_oa(chunk)
+
+    def flush(self):
+        """Kalan girişi ve çekirdek kuyruğunu döndürür, durumu sıfırlar."""
+        m = len(self.h)
+        if self.method == "direct":
+            ext = np.concatenate((self._history, np.zeros(m - 1)))
+            out = self._direct_block(ext, m - 1)
+        elif self._n_pending:
+            seg = self._pending[:self._n_pending]
+            out = np.concatenate((self._oa_block(seg), self._tail))
+        else:
+            out = self._tail.copy()
+        self.reset()
+        return out
+
+    def stream(self, chunks):
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield self.flush()
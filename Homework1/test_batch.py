@@ -0,0 +1,25 @@
+import numpy as np
+
+import batch
+from batch import batch_convolve
+
+
+def reference(x, h):
+    return np.stack([np.convolve(row, h) for row in x])
+
+def test_pool_with_fewer_rows_than_chunks():
+    # 3 satır, jobs=2 → linspace 9 sınır üretir; tekrar eden sınırlar boş aralık olmamalı
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((3, 2 ** 21))
+    h = rng.standard_normal(100)
+    np.testing.assert_allclose(batch_convolve(x, h, jobs=2), reference(x, h), atol=1e-8)
+
+def test_pool_forced_on_small_input(monkeypatch):
+    monkeypatch.setattr(batch, "POOL_MIN_WORK", 0)
+    rng = np.random.default_rng(1)
+    x = rng.standard_normal((2, 64))
+    h = rng.standard_normal(5)
+    np.testing.assert_allclose(batch_convolve(x, h, jobs=4, method="direct"), reference(x, h), atol=1e-10)
+
+def test_rows_per_block_never_zero():
+    assert batch._rows_per_block(0, 1, 10) == 1
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from convolution import convolve
+from streaming import StreamingConvolver, iter_chunks
+
+
+@pytest.mark.parametrize("method, m", [("direct", 7), ("direct", 40), ("oa", 7), ("oa", 100)])
+def test_stream_bit_exact(method, m):
+    rng = np.random.default_rng(m)
+    x = rng.standard_normal(3000)
+    h = rng.standard_normal(m)
+    ref = convolve(x, h, method=method)
+    conv = StreamingConvolver(h, method)
+    for size in (1, m - 1, 997, len(x)):
+        y = np.concatenate(list(conv.stream(iter_chunks(x, size))))
+        np.testing.assert_array_equal(y, ref)
+
+def test_auto_rejected():
+    with pytest.raises(ValueError):
+        StreamingConvolver(np.ones(5), "auto")
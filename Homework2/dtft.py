@@ -0,0 +1,134 @@
+from functools import cached_property
+
+import numpy as np
+from scipy.signal import CZT
+
+CHUNK = 8192            # bir seferde işlenen frekans noktası sayısı
+CZT_MIN_TAPS = 256      # bu boydan uzun FIR'lar düzgün ızgarada chirp-z (FFT) ile örneklenir
+SIN_EPS = 1e-12         # sin(Ω/2) bu değerin altındaysa limit formülü kullanılır
+POWER_SUM_MAX_N = 4096  # bu N'e kadar yoğun N kümeleri ardışık kuvvet toplamıyla hesaplanır
+
+
+class DTFT:
+    """
+    Sabit bir Ω ızgarası üzerinde H(e^{jΩ}) değerlendirici.
+    exp(-jΩ) tabanı ve yarım açı sinüs/kosinüsleri bir kez hesaplanıp saklanır.
+    """
+
+    def __init__(self, omega, chunk=CHUNK):
+        self.omega = np.asarray(omega, dtype=float)
+        if self.omega.ndim != 1 or len(self.omega) == 0:
+            raise ValueError("Ω boş olmayan tek boyutlu dizi olmalı")
+        self.chunk = chunk
+
+    @classmethod
+    def grid(cls, start=-2 * np.pi, stop=2 * np.pi, num=4096, **kwargs):
+        return cls(np.linspace(start, stop, num, endpoint=False), **kwargs)
+
+    @cached_property
+    def basis(self):
+        return np.exp(-1j * self.omega)
+
+    @cached_property
+    def half_sin(self):
+        return np.sin(self.omega / 2)
+
+    @cached_property
+    def half_cos(self):
+        return np.cos(self.omega / 2)
+
+    @cached_property
+    def step(self):
+        # Düzgün ızgaraysa adım, değilse None
+        if len(self.omega) < 2:
+            return None
+        d = np.diff(self.omega)
+        if np.allclose(d, d[0], rtol=1e-9, atol=0) and d[0] != 0:
+            return (self.omega[-1] - self.omega[0]) / (len(self.omega) - 1)
+        return None
+
+    def _slices(self):
+        for start in range(0, len(self.omega), self.chunk):
+            yield slice(start, min(start + self.chunk, len(self.omega)))
+
+    def _boxcar_power_sum(self, sl, N):
+        # H_N = Σ_{n<N} z^n; tüm N değerleri tek bir ardışık toplamdan okunur
+        z = self.basis[sl]
+        H = np.empty((len(N), len(z)), dtype=complex)
+        rows = {}
+        for i, n in enumerate(N):
+            rows.setdefault(n, []).append(i)
+        p = np.ones_like(z)
+        S = np.zeros_like(z)
+        for n in range(1, N.max() + 1):
+            S += p
+            for i in rows.get(n, ()):
+                H[i] = S
+            p *= z
+        return H
+
+    def _boxcar_closed_form(self, sl, N):
+        N = N[:, None].astype(float)
+        om = self.omega[sl]
+        s = self.half_sin[sl]
+        small = np.abs(s) < SIN_EPS
+        s_safe = np.where(small, 1.0, s)
+        ratio = np.where(small,
+                         N * np.cos(N * om / 2) / self.half_cos[sl],
+                         np.sin(N * om / 2) / s_safe)
+        return np.exp(-0.5j * (N - 1) * om) * ratio
+
+    def iter_boxcar(self, N_values):
+        """
+        H(e^{jΩ}) = (1 - e^{-jΩN}) / (1 - e^{-jΩ}) için parça parça (slice, H) üretir.
+        Bölme yerine ya Σ e^{-jΩn} kuvvet toplamı ya da e^{-jΩ(N-1)/2} · sin(NΩ/2) / sin(Ω/2)
+        kapalı formu kullanılır; Ω = 2πk noktalarında limit N·cos(NΩ/2) / cos(Ω/2) alınır.
+        """
+        N = np.atleast_1d(np.asarray(N_values, dtype=int))
+        if N.ndim != 1 or N.min() < 1:
+            raise ValueError("N değerleri pozitif tam sayı olmalı")
+        dense = N.max() <= min(POWER_SUM_MAX_N, 8 * len(N))
+        for sl in self._slices():
+            if dense:
+                yield sl, self._boxcar_power_sum(sl, N)
+            else:
+                yield sl, self._boxcar_closed_form(sl, N)
+
+    def boxcar(self, N_values, out=None):
+        if out is None:
+            out = np.empty((len(np.atleast_1d(N_values)), len(self.omega)), dtype=complex)
+        for sl, H in self.iter_boxcar(N_values):
+            out[:, sl] = H
+        return out
+
+    def _vandermonde(self, sl, taps):
+        # V[n] = exp(-jΩn), önbellekteki tabanın ardışık kuvvetleri
+        z = self.basis[sl]
+        V = np.empty((taps, len(z)), dtype=complex)
+        V[0] = 1
+        for n in range(1, taps):
+            np.multiply(V[n - 1], z, out=V[n])
+        return V
+
+    def iter_fir(self, b):
+        """Keyfi FIR katsayıları (L,) veya (F, L) için parça parça (slice, H) üretir."""
+        b = np.atleast_2d(np.asarray(b))
+        taps = b.shape[-1]
+        if taps > CZT_MIN_TAPS and self.step is not None:
+            # Düzgün ızgarada chirp-z dönüşümü: FFT tabanlı örnekleme
+            w0, d = self.omega[0], self.step
+            for sl in self._slices():
+                czt = CZT(taps, sl.stop - sl.start, w=np.exp(-1j * d), a=np.exp(1j * (w0 + d * sl.start)))
+                yield sl, czt(b, axis=-1)
+        else:
+            for sl in self._slices():
+                yield sl, b @ self._vandermonde(sl, taps)
+
+    def fir(self, b, out=None):
+        b = np.asarray(b)
+        if out is None:
+            shape = (len(self.omega),) if b.ndim == 1 else (b.shape[0], len(self.omega))
+            out = np.empty(shape, dtype=complex)
+        for sl, H in self.iter_fir(b):
+            out[..., sl] = H if b.ndim > 1 else H[0]
+        return out
@@ -1,23 +1,20 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from dtft import DTFT
+
 Omega = np.arange(-2*np.pi, 2*np.pi, 0.1)
 
 N_values = [3, 6, 9, 21]
 fig, axs = plt.subplots(len(N_values), 2, figsize=(10, 12))
 fig.suptitle('DTFT H(e^{jΩ}) için Genlik ve Faz Spektrumu')
 
+# H(e^{jΩ}) = (1 - e^{-jΩN}) / (1 - e^{-jΩ}), tüm N değerleri için tek geçişte
+H_all = DTFT(Omega).boxcar(N_values)
+
 for idx, N in enumerate(N_values):
 
-    # H(e^{jΩ}) = (1 - e^{-jΩN}) / (1 - e^{-jΩ})
-    
-    numerator   = 1 - np.exp(-1j * Omega * N)
-    denominator = 1 - np.exp(-1j * Omega)
-    
-    epsilon = 1e-12
-    denominator_safe = np.where(np.abs(denominator) < epsilon, epsilon, denominator)
-    
-    H = numerator / denominator_safe
+    H = H_all[idx]
     
     magnitude = np.abs(H)
     phase     = np.angle(H)
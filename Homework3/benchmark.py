@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+.data okuma hızı: eski read_signal yolu (read_text + replace + np.fromstring) ile
+signal_io.read_data karşılaştırması. Küçük dosyalarda dosya başına süre, büyük bir
+yapay dosyada ise MB/s ölçülür; iki yolun sonuçlarının bire bir aynı olduğu da denetlenir.
+
+Kullanım
+-------
+$ python benchmark.py                         # data/*.data + 5 milyon değerlik yapay dosya
+$ python benchmark.py --values 20000000 --repeat 5
+$ python benchmark.py dosya1.data dosya2.data --values 0
+"""
+import argparse
+import tempfile
+import timeit
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+from signal_io import read_data
+
+
+def read_old(path):
+    txt = path.read_text().strip().replace("\n", "")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        return np.fromstring(txt, sep=",")
+
+def synthetic(path, n):
+    # Ödev dosyalarıyla aynı biçim: iki ondalıklı, virgülle ayrılmış değerler
+    sig = np.random.default_rng(0).normal(0, 1, n)
+    np.savetxt(path, sig[None, :], fmt="%.2f", delimiter=",")
+
+def best(fn, repeat, number=1):
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+def main():
+    p = argparse.ArgumentParser(description=".data okuma karşılaştırması")
+    p.add_argument("files", nargs="*", type=Path)
+    p.add_argument("--values", type=int, default=5_000_000, help="Yapay dosyadaki değer sayısı (0: atla)")
+    p.add_argument("--repeat", type=int, default=3)
+    args = p.parse_args()
+    files = args.files or sorted((Path(__file__).parent / "data").glob("*.data"))
+
+    for path in files:
+        if not np.array_equal(read_old(path), read_data(path)):
+            raise SystemExit(f"{path.name}: iki yolun sonucu farklı")
+    if files:
+        t_old = best(lambda: [read_old(f) for f in files], args.repeat, number=200) / len(files)
+        t_new = best(lambda: [read_data(f) for f in files], args.repeat, number=200) / len(files)
+        print(f"{len(files)} dosya  eski: {t_old * 1e6:7.1f} µs/dosya  "
+              f"read_data: {t_new * 1e6:7.1f} µs/dosya  hız: {t_old / t_new:4.2f}x")
+
+    if args.values:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "buyuk.data"
+            synthetic(path, args.values)
+            mb = path.stat().st_size / 2 ** 20
+            if not np.array_equal(read_old(path), read_data(path)):
+                raise SystemExit("yapay dosyada iki yolun sonucu farklı")
+            t_old = best(lambda: read_old(path), args.repeat)
+            t_new = best(lambda: read_data(path), args.repeat)
+            print(f"{mb:.1f} MB  eski: {mb / t_old:6.1f} MB/s  "
+                  f"read_data: {mb / t_new:6.1f} MB/s  hız: {t_old / t_new:4.2f}x")
+
+if __name__ == "__main__":
+    main()
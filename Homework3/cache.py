@@ -0,0 +1,75 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+CACHE_DIR = ".dtmf_cache"
+CACHE_MAX_MB = 1024
+
+
+class SignalCache:
+    """
+    Çözülmüş sinyaller için disk önbelleği. Anahtar: dosya yolu + mtime + boyut.
+    Her kayıt bir .npy (örnekler) ve küçük bir .json (kaynak, fs) dosyasıdır; .npy
+    np.load(mmap_mode="r") ile açıldığı için tekrar eden çalıştırmalarda ne ayrıştırma
+    ne de kopya vardır. Boyut sınırı aşıldığında en eski kullanılan kayıtlar silinir.
+    """
+
+    def __init__(self, root=CACHE_DIR, max_bytes=CACHE_MAX_MB * 2 ** 20, rebuild=False):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.rebuild = rebuild
+
+    def _key(self, path: Path) -> str:
+        st = path.stat()
+        ident = f"{path.resolve()}|{st.st_mtime_ns}|{st.st_size}"
+        return hashlib.sha1(ident.encode()).hexdigest()
+
+    def load(self, path: Path) -> tuple[int | None, np.ndarray] | None:
+        if self.rebuild:
+            return None
+        key = self._key(path)
+        npy, meta = self.root / f"{key}.npy", self.root / f"{key}.json"
+        try:
+            fs = json.loads(meta.read_text())["fs"]
+            sig = np.load(npy, mmap_mode="r")
+            os.utime(npy)       # LRU için son kullanım zamanı
+        except (OSError, ValueError, KeyError):
+            return None
+        return fs, sig
+
+    def store(self, path: Path, fs: int | None, sig: np.ndarray):
+        # Geçici dosyaya yazıp os.replace ile yerleştirir; paralel işçiler yarım kayıt görmez
+        self.root.mkdir(parents=True, exist_ok=True)
+        key = self._key(path)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, np.ascontiguousarray(sig, dtype=float))
+        os.replace(tmp, self.root / f"{key}.npy")
+        meta = {"source": str(path.resolve()), "fs": None if fs is None else int(fs)}
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, self.root / f"{key}.json")
+
+    def evict(self):
+        """Toplam boyut max_bytes altına inene kadar en eski kayıtları siler."""
+        if not self.root.is_dir():
+            return
+        entries = []
+        for npy in self.root.glob("*.npy"):
+            try:
+                st = npy.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, npy))
+        total = sum(size for _, size, _ in entries)
+        for _, size, npy in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            npy.unlink(missing_ok=True)
+            npy.with_suffix(".json").unlink(missing_ok=True)
+            total -= size
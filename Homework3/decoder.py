@@ -0,0 +1,114 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from dtmf import KEYS, GoertzelBank, classify_frames
+
+FRAME_BATCH = 4096      # tek seferde sınıflandırılan çerçeve sayısı
+
+
+@dataclass
+class Digit:
+    key: str
+    start: float        # saniye
+    end: float          # saniye
+
+
+def tone_frames(ms, frame_ms, hop_ms):
+    # ms süren bir tonun tamamen içinde kalan çerçeve sayısı: (ms - frame)/hop + 1, yukarı yuvarlanır
+    return max(1, math.ceil((ms - frame_ms) / hop_ms + 1 - 1e-9))
+
+def gap_frames(ms, frame_ms, hop_ms):
+    # ms süren bir boşluğa değen (ms + frame)/hop çerçeveden, iki kenardaki yaklaşık frame/hop
+    # tanesi Hamming penceresinin ağırlıklı ortası tonda kaldığı için yine tuş olarak etiketlenir;
+    # kural tuşsuz etiketli çerçeveleri saydığından eşik (ms + frame)/hop - frame/hop olur
+    return max(1, math.ceil((ms + frame_ms) / hop_ms - frame_ms / hop_ms - 1e-9))
+
+
+class SequenceDecoder:
+    """
+    Uzun kayıtlarda tuş dizisi çözücü. Sinyal hop adımlı çerçevelerle, parça parça okunur;
+    her çerçevede Goertzel bankasıyla karar verilir, en kısa ton süresi ve tuşlar arası
+    en kısa sessizlik kurallarıyla zaman damgalı Digit olayları üretilir.
+    Bellek kullanımı parça boyu + bir çerçeve ile sınırlıdır.
+    """
+
+    def __init__(self, fs, frame_ms=25, hop_ms=10, min_tone_ms=40, min_gap_ms=40):
+        if hop_ms <= 0 or frame_ms < hop_ms:
+            raise ValueError("hop > 0 ve frame >= hop olmalı")
+        self.fs = fs
+        self.frame = max(2, int(round(fs * frame_ms / 1000)))
+        self.hop = max(1, int(round(fs * hop_ms / 1000)))
+        self.min_tone = tone_frames(min_tone_ms, frame_ms, hop_ms)
+        self.min_gap = gap_frames(min_gap_ms, frame_ms, hop_ms)
+        self.bank = GoertzelBank(fs)
+        self.window = np.hamming(self.frame)
+        self.window_sum = self.window.sum()
+        self.window_energy = np.dot(self.window, self.window)
+        self.reset()
+
+    def reset(self):
+        self._buf = np.empty(0)
+        self._next_frame = 0
+        self._run_key, self._run_start, self._run_len = -1, 0, 0
+        self._active, self._active_start, self._last_on = -1, 0, 0
+        self._prev_end = -(10 ** 9)
+
+    def _time(self, frame_idx, end=False):
+        return (frame_idx * self.hop + (self.frame if end else 0)) / self.fs
+
+    def _classify(self, frames):
+        xw = frames * self.window
+        mags = self.bank.frame_magnitudes(xw)
+        power = np.einsum("ij,ij->i", xw, xw) / self.window_energy
+        return classify_frames(mags, self.window_sum, power)
+
+    def _emit(self):
+        key = KEYS.flat[self._active]
+        digit = Digit(str(key), self._time(self._active_start), self._time(self._last_on, end=True))
+        self._prev_end = self._last_on
+        self._active = -1
+        return digit
+
+    def _step(self, f, k):
+        if k == self._run_key:
+            self._run_len += 1
+        else:
+            self._run_key, self._run_start, self._run_len = k, f, 1
+
+        if self._active >= 0:
+            if k == self._active:
+                self._last_on = f
+            elif f - self._last_on >= self.min_gap:
+                yield self._emit()
+
+        if (self._active < 0 and self._run_key >= 0 and self._run_len >= self.min_tone
+                and self._run_start - self._prev_end - 1 >= self.min_gap):
+            self._active, self._active_start, self._last_on = self._run_key, self._run_start, f
+
+    def feed(self, block):
+        """Yeni örnekleri işler, kesinleşen Digit olaylarını üretir."""
+        buf = np.concatenate((self._buf, np.asarray(block, dtype=float).ravel()))
+        if len(buf) < self.frame:
+            self._buf = buf
+            return
+        frames = sliding_window_view(buf, self.frame)[::self.hop]
+        for start in range(0, len(frames), FRAME_BATCH):
+            keys = self._classify(frames[start:start + FRAME_BATCH])
+            for i, k in enumerate(keys):
+                yield from self._step(self._next_frame + start + i, int(k))
+        self._next_frame += len(frames)
+        self._buf = buf[len(frames) * self.hop:]
+
+    def flush(self):
+        """Akışın sonunda açık kalan tuşu kapatır."""
+        digits = [self._emit()] if self._active >= 0 else []
+        self.reset()
+        return digits
+
+    def decode(self, chunks):
+        for chunk in chunks:
+            yield from self.feed(chunk)
+        yield from self.flush()
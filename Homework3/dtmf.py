@@ -0,0 +1,103 @@
+import numpy as np
+
+LOW = np.array([697, 770, 852, 941])
+HIGH = np.array([1209, 1336, 1477, 1633])
+TONES = np.concatenate((LOW, HIGH))
+KEYS = np.array([
+    ["1", "2", "3", "A"],
+    ["4", "5", "6", "B"],
+    ["7", "8", "9", "C"],
+    ["*", "0", "#", "D"],
+])
+TOL = 8
+
+BLOCK = 4096             # Goertzel bankasının blok uzunluğu
+MIN_TONE_SHARE = 0.5     # iki tonun toplam sinyal gücü içindeki en düşük payı
+MIN_GROUP_RATIO = 2.0    # seçilen ton, grubundaki ikinci en güçlü tondan bu kat güçlü olmalı
+
+
+class GoertzelBank:
+    """
+    Sadece verilen frekanslardaki DFT genliklerini hesaplayan Goertzel filtre bankası.
+    Goertzel özyinelemesinin N örnek sonunda verdiği X(ω) = Σ x[n]·e^{-jωn} değeri, örnek
+    başına Python döngüsü yerine sabit uzunluklu bloklar üzerinde matris çarpımıyla bulunur
+    (her ton için O(N)). Durum bloklar arasında taşındığı için sinyal parça parça verilebilir.
+    """
+
+    def __init__(self, fs, freqs=TONES, block=BLOCK):
+        self.fs = fs
+        self.freqs = np.asarray(freqs, dtype=float)
+        self.omega = 2 * np.pi * self.freqs / fs
+        self.block = block
+        self._tables = {}
+        self.reset()
+
+    def reset(self):
+        self._acc = np.zeros(len(self.freqs), dtype=complex)
+        self.count = 0
+
+    def _table(self, length):
+        # cos(ωn) ve sin(ωn) tabloları, (length, len(freqs)); uzunluk başına bir kez
+        if length not in self._tables:
+            arg = np.outer(np.arange(length), self.omega)
+            self._tables[length] = (np.cos(arg), np.sin(arg))
+        return self._tables[length]
+
+    def _partial(self, x, table_len):
+        # Her satır için Σ x[n]·e^{-jωn}; tablo uzunluğu x'in son boyutundan kısa olamaz
+        C, S = self._table(table_len)
+        n = x.shape[-1]
+        return x @ C[:n] - 1j * (x @ S[:n])
+
+    def update(self, block):
+        block = np.asarray(block, dtype=float).ravel()
+        full = len(block) // self.block * self.block
+        if full:
+            rows = block[:full].reshape(-1, self.block)
+            offsets = self.count + self.block * np.arange(len(rows))
+            phase = np.exp(-1j * np.outer(offsets, self.omega))
+            self._acc += (self._partial(rows, self.block) * phase).sum(axis=0)
+        rest = block[full:]
+        if len(rest):
+            self._acc += self._partial(rest, self.block) * np.exp(-1j * self.omega * (self.count + full))
+        self.count += len(block)
+
+    def magnitudes(self):
+        return np.abs(self._acc)
+
+    def frame_magnitudes(self, frames):
+        # (F, L) çerçevelerinin her biri için bağımsız genlikler → (F, len(freqs))
+        frames = np.asarray(frames, dtype=float)
+        return np.abs(self._partial(frames, frames.shape[-1]))
+
+
+def classify_frames(mags, window_sum, signal_power):
+    """
+    (F, 8) Goertzel genliklerinden (LOW + HIGH sırası) çerçeve başına tuş kararı.
+    KEYS.flat indeksini, eşleşme yoksa -1 döndürür.
+    signal_power: pencerelenmiş sinyalin sum((x·w)²) / sum(w²) değeri.
+    """
+    mags = np.atleast_2d(mags)
+    signal_power = np.atleast_1d(signal_power)
+    low_mags, high_mags = mags[:, :len(LOW)], mags[:, len(LOW):]
+    low_idx, high_idx = np.argmax(low_mags, axis=1), np.argmax(high_mags, axis=1)
+    rows = np.arange(len(mags))
+    low_peak, high_peak = low_mags[rows, low_idx], high_mags[rows, high_idx]
+
+    # Saf bir sinüs için |X| = A·sum(w)/2, gücü A²/2 = 2|X|² / sum(w)²
+    tone_power = 2 * (low_peak ** 2 + high_peak ** 2) / window_sum ** 2
+    valid = (signal_power > 0) & (tone_power >= MIN_TONE_SHARE * signal_power)
+    for group, peak in ((low_mags, low_peak), (high_mags, high_peak)):
+        runner_up = np.sort(group, axis=1)[:, -2]
+        valid &= peak >= MIN_GROUP_RATIO * runner_up
+    return np.where(valid, low_idx * KEYS.shape[1] + high_idx, -1)
+
+
+def classify_tones(mags, window_sum, signal_power):
+    """Tek bir genlik vektörü için (tuş ya da None, [düşük, yüksek] frekans)."""
+    mags = np.asarray(mags)
+    low_idx = int(np.argmax(mags[:len(LOW)]))
+    high_idx = int(np.argmax(mags[len(LOW):]))
+    freqs = np.array([LOW[low_idx], HIGH[high_idx]], dtype=float)
+    k = classify_frames(mags, window_sum, signal_power)[0]
+    return (KEYS.flat[k] if k >= 0 else None), freqs
@@ -3,39 +3,50 @@ Kullanım
 -------
 $ python dtmf_detector.py a.data b.data c.data                # varsayılan fs=4000 Hz
 $ python dtmf_detector.py tone1.wav --fs 8000 --no-plot       # başka örnekleme
+$ python dtmf_detector.py *.data --engine goertzel            # sadece 8 ton, FFT yok
+$ python dtmf_detector.py call.wav --sequence                 # uzun kayıtta tuş dizisi
+$ python dtmf_detector.py data/*.data --jobs 8 --no-plot      # paralel toplu işlem
+$ python dtmf_detector.py data/*.data --rebuild-cache         # önbelleği yeniden oluştur
 """
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 
 import numpy as np
-from scipy.io import wavfile
 from scipy.signal import find_peaks
-import matplotlib.pyplot as plt
 
-LOW = np.array([697, 770, 852, 941])
-HIGH = np.array([1209, 1336, 1477, 1633])
-KEYS = np.array([
-    ["1", "2", "3", "A"],
-    ["4", "5", "6", "B"],
-    ["7", "8", "9", "C"],
-    ["*", "0", "#", "D"],
-])
-TOL = 8 
+from decoder import Digit, SequenceDecoder
+from dtmf import LOW, HIGH, KEYS, TOL, GoertzelBank, classify_tones
+from plotting import PlotWorker
+from cache import CACHE_DIR, CACHE_MAX_MB, SignalCache
+from signal_io import iter_signal, read_signal
 
 
-def read_signal(path: Path, fs_cli: int | None) -> tuple[int, np.ndarray]:
-    if path.suffix.lower() in {".wav", ".wave"}:
-        fs, sig = wavfile.read(path)
-        if sig.ndim > 1:
-            sig = sig.mean(axis=1)
-        return fs, sig.astype(float)
+@dataclass
+class Result:
+    path: Path
+    key: str | None = None
+    freqs: np.ndarray | None = None
+    digits: list[Digit] = field(default_factory=list)
+    spectrum: tuple[np.ndarray, np.ndarray] | None = None
+    error: str | None = None
 
-    txt = path.read_text().strip().replace("\n", "")
-    sig = np.fromstring(txt, sep=",")
-    if fs_cli is None:
-        raise ValueError(".data dosyası için --fs ile örnekleme hızı belirt")
-    return fs_cli, sig
+
+def open_cache(args) -> SignalCache | None:
+    if args.no_cache:
+        return None
+    return SignalCache(args.cache_dir, args.cache_max_mb * 2 ** 20, rebuild=args.rebuild_cache)
+
+
+def decode_sequence(path: Path, args) -> list[Digit]:
+    fs, chunks = iter_signal(path, args.fs, cache=open_cache(args))
+    dec = SequenceDecoder(fs, frame_ms=args.frame_ms, hop_ms=args.hop_ms,
+                          min_tone_ms=args.min_tone_ms, min_gap_ms=args.min_gap_ms)
+    return list(dec.decode(chunks))
 
 
 def dominant(freqs: np.ndarray, mags: np.ndarray, n: int = 2):
@@ -46,12 +57,15 @@ def dominant(freqs: np.ndarray, mags: np.ndarray, n: int = 2):
     return np.sort(freqs[sel])
 
 
-def detect(fs: int, sig: np.ndarray):
+def spectrum(fs: int, sig: np.ndarray):
     N = len(sig)
-    win = np.hamming(N)
-    S = np.fft.rfft(sig * win)
     F = np.fft.rfftfreq(N, 1 / fs)
-    freqs = dominant(F, np.abs(S))
+    S = np.abs(np.fft.rfft(sig * np.hamming(N)))
+    return F, S
+
+
+def detect_spectrum(F: np.ndarray, S: np.ndarray):
+    freqs = dominant(F, S)
     if len(freqs) != 2:
         return None, freqs
     low_idx = np.argmin(np.abs(LOW - freqs[0]))
@@ -61,18 +75,60 @@ def detect(fs: int, sig: np.ndarray):
     return KEYS[low_idx, high_idx], freqs
 
 
-def spectrum_plot(path: Path, fs: int, sig: np.ndarray, key: str | None):
-    outdir = Path("dtmf_outputs"); outdir.mkdir(exist_ok=True)
-    N = len(sig)
-    F = np.fft.rfftfreq(N, 1 / fs)
-    S = np.abs(np.fft.rfft(sig * np.hamming(N)))
-    plt.figure(figsize=(6, 3))
-    plt.plot(F, S)
-    plt.title(f"Spectrum — {path.stem} ({key or 'unknown'})")
-    plt.xlabel("Frequency (Hz)"); plt.ylabel("Amplitude")
-    plt.xlim(0, 2000); plt.tight_layout()
-    plt.savefig(outdir / f"{path.stem}.png", dpi=300)
-    plt.close()
+def detect(fs: int, sig: np.ndarray):
+    return detect_spectrum(*spectrum(fs, sig))
+
+
+def detect_goertzel(fs: int, sig: np.ndarray):
+    win = np.hamming(len(sig))
+    xw = sig * win
+    bank = GoertzelBank(fs)
+    bank.update(xw)
+    signal_power = np.dot(xw, xw) / np.dot(win, win)
+    return classify_tones(bank.magnitudes(), win.sum(), signal_power)
+
+
+ENGINES = {"fft": detect, "goertzel": detect_goertzel}
+
+
+def process_file(path: Path, args) -> Result:
+    # Süreç havuzunda çalışır; sadece küçük sonuç nesnesi geri döner
+    res = Result(path)
+    try:
+        if args.sequence:
+            res.digits = decode_sequence(path, args)
+            return res
+        fs, sig = read_signal(path, args.fs, cache=open_cache(args))
+        if args.engine == "fft":
+            # Tespit sırasında hesaplanan spektrum grafikte yeniden kullanılır
+            F, S = spectrum(fs, sig)
+            res.key, res.freqs = detect_spectrum(F, S)
+            if not args.no_plot:
+                res.spectrum = (F, S)
+        else:
+            res.key, res.freqs = ENGINES[args.engine](fs, sig)
+            if not args.no_plot:
+                res.spectrum = spectrum(fs, sig)
+    except Exception as e:
+        res.error = str(e)
+    return res
+
+
+def report(res: Result, sequence: bool):
+    name = res.path.name
+    if res.error is not None:
+        print(f"❌ {name}: {res.error}")
+    elif sequence:
+        for d in res.digits:
+            print(f"    {d.start:9.3f}s – {d.end:9.3f}s   {d.key}")
+        if res.digits:
+            print(f"\n✅ {name}: Tuş dizisi {''.join(d.key for d in res.digits)}\n")
+        else:
+            print(f"⚠️  {name}: Tuş bulunamadı")
+    elif res.key is None:
+        print(f"⚠️  {name}: Eşleşme yok  →  {res.freqs[0]:.1f} & {res.freqs[1]:.1f} Hz")
+    else:
+        print(f"\n✅ {name}: Tuş {res.key}  →  {res.freqs[0]:.1f} & {res.freqs[1]:.1f} Hz\n")
 
 
 def main():
@@ -80,23 +136,40 @@ def main():
     p.add_argument("files", nargs="+", help="Girdi dosyaları")
     p.add_argument("--fs", type=int, default=4000, help=".data dosyaları için örnekleme hızı (Hz)")
     p.add_argument("--no-plot", action="store_true", help="Spektrum grafiği oluşturma")
+    p.add_argument("--engine", choices=sorted(ENGINES), default="fft",
+                   help="Tespit yöntemi: tam FFT veya 8 tonluk Goertzel bankası")
+    p.add_argument("--sequence", action="store_true",
+                   help="Kaydı çerçeve çerçeve tarayıp zaman damgalı tuş dizisi çıkar")
+    p.add_argument("--frame-ms", type=float, default=25, help="Dizi modu çerçeve uzunluğu (ms)")
+    p.add_argument("--hop-ms", type=float, default=10, help="Dizi modu çerçeve adımı (ms)")
+    p.add_argument("--min-tone-ms", type=float, default=40, help="En kısa geçerli ton süresi (ms)")
+    p.add_argument("--min-gap-ms", type=float, default=40, help="Tuşlar arası en kısa sessizlik (ms)")
+    p.add_argument("--jobs", type=int, default=1,
+                   help="Dosyaları N süreçlik havuzda paralel işle")
+    p.add_argument("--cache-dir", default=CACHE_DIR, help="Çözülmüş sinyal önbelleği klasörü")
+    p.add_argument("--cache-max-mb", type=float, default=CACHE_MAX_MB,
+                   help="Önbelleğin en fazla boyutu (MB); aşılınca en eski kayıtlar silinir")
+    p.add_argument("--no-cache", action="store_true", help="Önbelleği okuma ve yazma")
+    p.add_argument("--rebuild-cache", action="store_true",
+                   help="Önbellekteki kayıtları yok say ve yeniden yaz")
     args = p.parse_args()
 
-    for fp in args.files:
-        path = Path(fp)
-        try:
-            fs, sig = read_signal(path, args.fs)
-        except Exception as e:
-            print(f"❌ {path.name}: {e}")
-            continue
-        key, freqs = detect(fs, sig)
-        if key is None:
-            print(f"⚠️  {path.name}: Eşleşme yok  →  {freqs[0]:.1f} & {freqs[1]:.1f} Hz")
+    paths = [Path(fp) for fp in args.files]
+    work = partial(process_file, args=args)
+    pool = ProcessPoolExecutor(args.jobs) if args.jobs > 1 else nullcontext()
+    with PlotWorker(enabled=not args.no_plot and not args.sequence) as plots, pool:
+        if args.jobs > 1:
+            results = pool.map(work, paths, chunksize=max(1, len(paths) // (args.jobs * 8)))
         else:
-            print(f"\n✅ {path.name}: Tuş {key}  →  {freqs[0]:.1f} & {freqs[1]:.1f} Hz\n")
-        if not args.no_plot:
-            spectrum_plot(path, fs, sig, key)
-
+            results = map(work, paths)
+        for res in results:
+            report(res, args.sequence)
+            if res.spectrum is not None:
+                plots.submit(res.path, *res.spectrum, res.key)
+
+    cache = open_cache(args)
+    if cache is not None:
+        cache.evict()
 
 if __name__ == "__main__":
     main()
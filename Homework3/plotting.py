@@ -0,0 +1,61 @@
+import multiprocessing as mp
+from pathlib import Path
+
+import numpy as np
+
+PLOT_FMAX = 2000        # grafikte gösterilen en yüksek frekans (Hz)
+QUEUE_SIZE = 64         # çizim kuyruğunda bekleyebilecek en fazla iş
+
+
+def spectrum_plot(path: Path, F: np.ndarray, S: np.ndarray, key: str | None):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    outdir = Path("dtmf_outputs"); outdir.mkdir(exist_ok=True)
+    plt.figure(figsize=(6, 3))
+    plt.plot(F, S)
+    plt.title(f"Spectrum — {path.stem} ({key or 'unknown'})")
+    plt.xlabel("Frequency (Hz)"); plt.ylabel("Amplitude")
+    plt.xlim(0, PLOT_FMAX); plt.tight_layout()
+    plt.savefig(outdir / f"{path.stem}.png", dpi=300)
+    plt.close()
+
+
+def _plot_loop(queue):
+    while (job := queue.get()) is not None:
+        try:
+            spectrum_plot(*job)
+        except Exception as e:
+            print(f"❌ {job[0].name}: grafik çizilemedi: {e}")
+
+
+class PlotWorker:
+    """
+    Spektrum grafiklerini ayrı bir süreçte, sınırlı bir kuyruktan çizer; böylece tespit
+    döngüsü matplotlib'i beklemez. enabled=False ise submit hiçbir şey yapmaz.
+    """
+
+    def __init__(self, enabled=True, queue_size=QUEUE_SIZE):
+        self.enabled = enabled
+        self.queue_size = queue_size
+        self._queue = None
+        self._proc = None
+
+    def __enter__(self):
+        if self.enabled:
+            self._queue = mp.Queue(self.queue_size)
+            self._proc = mp.Process(target=_plot_loop, args=(self._queue,), daemon=True)
+            self._proc.start()
+        return self
+
+    def submit(self, path: Path, F: np.ndarray, S: np.ndarray, key: str | None):
+        if self.enabled:
+            # Sadece çizilen bant (ve kenara uzanan bir nokta) kuyruğa gönderilir
+            n = np.searchsorted(F, PLOT_FMAX, side="right") + 1
+            self._queue.put((path, F[:n], S[:n], key))
+
+    def __exit__(self, *exc):
+        if self._proc is not None:
+            self._queue.put(None)
+            self._proc.join()
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from decoder import SequenceDecoder
+from dtmf import HIGH, KEYS, LOW
+
+FS = 8000
+NOISE = 0.05
+OFFSETS = range(0, 80, 8)       # tonların çerçeve ızgarasına göre farklı hizalanması (örnek)
+
+
+def tone(key, ms):
+    row, col = map(int, np.argwhere(KEYS == key)[0])
+    t = np.arange(int(FS * ms / 1000)) / FS
+    return 0.5 * np.sin(2 * np.pi * LOW[row] * t) + 0.5 * np.sin(2 * np.pi * HIGH[col] * t)
+
+def silence(ms):
+    return np.zeros(int(FS * ms / 1000))
+
+def decode(parts, offset, seed=0):
+    sig = np.concatenate([np.zeros(offset), silence(100), *parts, silence(100)])
+    sig += NOISE * np.random.default_rng(seed).standard_normal(len(sig))
+    dec = SequenceDecoder(FS)
+    return [d.key for d in dec.decode(np.array_split(sig, 7))]
+
+@pytest.mark.parametrize("ms", [15, 20])
+def test_short_tone_rejected(ms):
+    for offset in OFFSETS:
+        assert decode([tone('5', ms)], offset) == []
+
+@pytest.mark.parametrize("ms", [15, 20])
+def test_short_dropout_does_not_split_digit(ms):
+    for offset in OFFSETS:
+        assert decode([tone('5', 100), silence(ms), tone('5', 100)], offset) == ['5']
+
+def test_min_tone_and_gap_decoded():
+    for offset in OFFSETS:
+        parts = [tone('5', 40), silence(40), tone('5', 40), silence(40), tone('9', 40)]
+        assert decode(parts, offset) == ['5', '5', '9']
@@ -0,0 +1,67 @@
+import numpy as np
+
+BLOCK_PIXELS = 1 << 22      # bincount'un bir seferde işlediği piksel sayısı
+
+
+def n_bins(dtype) -> int:
+    dtype = np.dtype(dtype)
+    if dtype == np.uint8:
+        return 256
+    if dtype == np.uint16:
+        return 65536
+    raise TypeError(f"Histogram için uint8 veya uint16 görüntü gerekli, gelen: {dtype}")
+
+
+def _row_blocks(n_rows: int, row_pixels: int):
+    step = max(1, BLOCK_PIXELS // max(1, row_pixels))
+    for r in range(0, n_rows, step):
+        yield slice(r, min(r + step, n_rows))
+
+
+def valid_mask(img: np.ndarray, mask: np.ndarray | None = None, nodata: int | None = None):
+    # True = histograma girecek piksel; ikisi de verilmemişse None
+    if nodata is not None:
+        nd = img != nodata
+        mask = nd if mask is None else (mask & nd)
+    return mask
+
+
+def histogram(img: np.ndarray, mask: np.ndarray | None = None, nodata: int | None = None) -> np.ndarray:
+    """
+    8/16 bit görüntünün histogramı (256 veya 65536 kutu, int64).
+    Piksel başına Python döngüsü yok; satır blokları halinde bincount ile sayılır,
+    böylece tam görüntü boyutunda geçici bir kopya oluşmaz.
+    mask: True olan pikseller sayılır. nodata: bu değere eşit pikseller sayılmaz.
+    """
+    bins = n_bins(img.dtype)
+    hist = np.zeros(bins, dtype=np.int64)
+    if img.size == 0:
+        return hist
+    rows = img.reshape(img.shape[0], -1) if img.ndim > 1 else img.reshape(1, -1)
+    if mask is not None:
+        mask = np.broadcast_to(mask, img.shape).reshape(rows.shape)
+    for sl in _row_blocks(rows.shape[0], rows.shape[1]):
+        block = rows[sl]
+        if mask is not None or nodata is not None:
+            m = valid_mask(block, None if mask is None else mask[sl], nodata)
+            values = block[m]
+        else:
+            values = block.ravel()
+        hist += np.bincount(values, minlength=bins)
+    return hist
+
+
+def band_histograms(img: np.ndarray, mask: np.ndarray | None = None, nodata: int | None = None,
+                    axis: int = -1) -> np.ndarray:
+    """
+    Çok bantlı raster için (bant sayısı, kutu sayısı) boyutunda bant başına histogramlar.
+    mask ya raster ile aynı boyutta ya da bant ekseni olmadan (tüm bantlar için ortak) olabilir.
+    """
+    if img.ndim < 3:
+        return histogram(img, mask, nodata)[None, :]
+    bands = np.moveaxis(img, axis, 0)
+    if mask is not None and mask.ndim == img.ndim:
+        masks = np.moveaxis(mask, axis, 0)
+    else:
+        masks = [mask] * bands.shape[0]
+    return np.stack([histogram(bands[b], masks[b], nodata) for b in range(bands.shape[0])])
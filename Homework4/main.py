@@ -1,9 +1,25 @@
 #!/usr/bin/env python3
+"""
+Kullanım
+-------
+$ python main.py                                      # IMAGES listesi, sırayla
+$ python main.py img/*.png --jobs 4                   # süreç havuzu + arka planda çizim
+$ python main.py img/*.png --jobs 4 --no-plots --npz hist.npz
+"""
+import argparse
+import multiprocessing as mp
 import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import cv2                          
 import numpy as np                  
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt     
 
+from histogram import histogram
+from tiled import tiled_stretch
+
 IMAGES = [                          
     "img/img1.png",
     "img/img2.png",
@@ -14,6 +30,7 @@ IMAGES = [
 
 OUTDIR = "odev4_out"            
 LO, HI = 5, 95              
+PLOT_QUEUE = 16                 # çizim kuyruğunda bekleyebilecek en fazla iş
 
 def read_gray(path: str) -> np.ndarray:
     img = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
@@ -22,12 +39,9 @@ def read_gray(path: str) -> np.ndarray:
     return img
 
 def manual_histogram(img: np.ndarray) -> np.ndarray:
-    hist = np.zeros(256, dtype=int)
-    for px in img.flatten():
-        hist[px] += 1
-    return hist
+    return histogram(img)
 
-def plot_hist(name: str, hist: np.ndarray):
+def plot_hist(name: str, hist: np.ndarray, outdir: str = OUTDIR):
     xs = np.arange(256)
     plt.figure(figsize=(8, 4))
     plt.plot(xs, hist, label="Normal")
@@ -37,10 +51,10 @@ def plot_hist(name: str, hist: np.ndarray):
     plt.ylabel("Frekans")
     plt.legend()
     plt.tight_layout()
-    plt.savefig(os.path.join(OUTDIR, f"{name}_hist.png"), dpi=200)
+    plt.savefig(os.path.join(outdir, f"{name}_hist.png"), dpi=200)
     plt.close()
 
-def plot_cumulative(name: str, hist: np.ndarray):
+def plot_cumulative(name: str, hist: np.ndarray, outdir: str = OUTDIR):
     cum = hist.cumsum()
     plt.figure(figsize=(8, 4))
     plt.plot(np.arange(256), cum)
@@ -48,42 +62,113 @@ def plot_cumulative(name: str, hist: np.ndarray):
     plt.xlabel("Piksel Değeri")
     plt.ylabel("Kümülatif Frekans")
     plt.tight_layout()
-    plt.savefig(os.path.join(OUTDIR, f"{name}_cum.png"), dpi=200)
+    plt.savefig(os.path.join(outdir, f"{name}_cum.png"), dpi=200)
     plt.close()
 
-def auto_stretch(img: np.ndarray, lo: float, hi: float) -> np.ndarray:
-    lo_val, hi_val = np.percentile(img, (lo, hi))
-    # Bölü sıfır koruması
-    if hi_val == lo_val:
-        return img.copy()
-    stretched = (img - lo_val) * 255.0 / (hi_val - lo_val)
-    stretched = np.clip(stretched, 0, 255).astype(np.uint8)
-    return stretched
+def auto_stretch(img: np.ndarray, lo: float, hi: float, hist: np.ndarray | None = None) -> np.ndarray:
+    # Yüzdelikler kümülatif histogramdan, germe 256'lık LUT ile; sıralama ve float kopya yok
+    return tiled_stretch(img, lo, hi, hist=hist)
+
+def image_name(path: str) -> str:
+    # Çıktı dosyaları ve .npz anahtarı için ad: uzantısız dosya adı
+    return os.path.splitext(os.path.basename(path))[0]
+
+def process_image(path: str, outdir: str, lo: float, hi: float) -> tuple[str, np.ndarray]:
+    # Süreç havuzunda çalışır: histogram + germe + PNG yazımı; geriye sadece histogram döner
+    name = image_name(path)
+    img = read_gray(path)
+    hist = manual_histogram(img)
+    stretched = auto_stretch(img, lo, hi, hist)
+    cv2.imwrite(os.path.join(outdir, f"{name}_stretch.png"), stretched)
+    return name, hist
+
+def _plot_loop(queue, outdir: str):
+    while (job := queue.get()) is not None:
+        name, hist = job
+        try:
+            plot_hist(name, hist, outdir)
+            plot_cumulative(name, hist, outdir)
+        except Exception as e:
+            print(f"❌ {name}: grafik çizilemedi: {e}")
+
+class PlotWorker:
+    """Grafikleri ayrı bir süreçte, sınırlı bir kuyruktan çizer; hesaplama beklemeden devam eder."""
+
+    def __init__(self, outdir: str, enabled: bool = True, queue_size: int = PLOT_QUEUE):
+        self.outdir = outdir
+        self.enabled = enabled
+        self.queue_size = queue_size
+        self._queue = None
+        self._proc = None
+
+    def __enter__(self):
+        if self.enabled:
+            self._queue = mp.Queue(self.queue_size)
+            self._proc = mp.Process(target=_plot_loop, args=(self._queue, self.outdir), daemon=True)
+            self._proc.start()
+        return self
+
+    def submit(self, name: str, hist: np.ndarray):
+        if self.enabled:
+            self._queue.put((name, hist))
+
+    def __exit__(self, *exc):
+        if self._proc is not None:
+            self._queue.put(None)
+            self._proc.join()
 
 def main():
-    os.makedirs(OUTDIR, exist_ok=True)
-
-    for path in IMAGES:
-        name = os.path.splitext(os.path.basename(path))[0]
-        print(f"--> {name} işleniyor…")
-
-        img = read_gray(path)
-
-        # a) Histogram
-        hist = manual_histogram(img)
-
-        # b) Normal + Log histogram grafiği
-        plot_hist(name, hist)
-
-        # c) Kümülatif histogram
-        plot_cumulative(name, hist)
-
-        # d) Otomatik kontrast
-        stretched = auto_stretch(img, LO, HI)
-        cv2.imwrite(os.path.join(OUTDIR, f"{name}_stretch.png"), stretched)
-        print("    ✔ tamamlandı")
-
-    print("\nBitti. Çıktılar:", OUTDIR)
+    p = argparse.ArgumentParser(description="Histogram ve otomatik kontrast germe")
+    p.add_argument("images", nargs="*", default=IMAGES, help="Girdi görüntüleri")
+    p.add_argument("--outdir", default=OUTDIR, help="Çıktı klasörü")
+    p.add_argument("--lo", type=float, default=LO, help="Alt yüzdelik")
+    p.add_argument("--hi", type=float, default=HI, help="Üst yüzdelik")
+    p.add_argument("--jobs", type=int, default=1, help="Görüntüleri N süreçlik havuzda işle")
+    p.add_argument("--no-plots", action="store_true", help="Histogram grafiklerini çizme")
+    p.add_argument("--npz", default=None, help="Tüm histogramları tek bir sıkıştırılmış .npz'ye yaz")
+    args = p.parse_args()
+
+    # Aynı adlı girdiler (ör. a/img.png, b/img.png) çıktı PNG'lerini ve .npz anahtarını ezerdi
+    clashes = sorted(name for name, count in Counter(map(image_name, args.images)).items() if count > 1)
+    if clashes:
+        p.error(f"Aynı ada sahip girdiler birbirinin çıktısını ezer: {', '.join(clashes)}")
+
+    os.makedirs(args.outdir, exist_ok=True)
+    hists = {}
+
+    with PlotWorker(args.outdir, enabled=not args.no_plots) as plots:
+        if args.jobs > 1:
+            with ProcessPoolExecutor(args.jobs) as pool:
+                futures = {pool.submit(process_image, path, args.outdir, args.lo, args.hi): path
+                           for path in args.images}
+                for fut in as_completed(futures):
+                    try:
+                        name, hist = fut.result()
+                    except Exception as e:
+                        print(f"❌ {futures[fut]}: {e}")
+                        continue
+                    print(f"--> {name} ✔ tamamlandı")
+                    hists[name] = hist
+                    plots.submit(name, hist)
+        else:
+            for path in args.images:
+                print(f"--> {image_name(path)} işleniyor…")
+                try:
+                    # a) Histogram, d) Otomatik kontrast
+                    name, hist = process_image(path, args.outdir, args.lo, args.hi)
+                except Exception as e:
+                    print(f"❌ {path}: {e}")
+                    continue
+                hists[name] = hist
+                # b) Normal + Log histogram, c) Kümülatif histogram
+                plots.submit(name, hist)
+                print("    ✔ tamamlandı")
+
+    if args.npz:
+        np.savez_compressed(args.npz, **hists)
+        print("Histogramlar:", args.npz)
+
+    print("\nBitti. Çıktılar:", args.outdir)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+RAM'den büyük rasterlar için karo karo histogram ve yüzdelik germe.
+
+Kullanım
+-------
+$ python tiled.py sahne.npy sahne_stretch.npy                 # varsayılan LO=5, HI=95
+$ python tiled.py sahne.npy out.npy --lo 2 --hi 98 --tile-rows 512
+"""
+
+import argparse
+import os
+
+import cv2
+import numpy as np
+
+from histogram import histogram, n_bins
+
+TILE_PIXELS = 1 << 22       # bir karodaki piksel sayısı (satır bandı olarak)
+
+
+def open_raster(path: str) -> np.ndarray:
+    # .npy dosyaları belleğe alınmadan eşlenir; diğer biçimler cv2 ile okunur
+    if path.lower().endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    img = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+    if img is None:
+        raise FileNotFoundError(f"Resim bulunamadı: {path}")
+    return img
+
+
+def iter_tiles(raster: np.ndarray, tile_rows: int | None = None):
+    if tile_rows is None:
+        row_pixels = int(np.prod(raster.shape[1:], dtype=np.int64)) or 1
+        tile_rows = max(1, TILE_PIXELS // row_pixels)
+    for r in range(0, raster.shape[0], tile_rows):
+        yield slice(r, min(r + tile_rows, raster.shape[0]))
+
+
+def tiled_histogram(raster: np.ndarray, tile_rows: int | None = None) -> np.ndarray:
+    hist = np.zeros(n_bins(raster.dtype), dtype=np.int64)
+    for sl in iter_tiles(raster, tile_rows):
+        hist += histogram(np.asarray(raster[sl]))
+    return hist
+
+
+def _lerp(a, b, t):
+    # np.percentile'ın 'linear' yöntemindeki ile aynı enterpolasyon
+    diff = b - a
+    return b - diff * (1 - t) if t >= 0.5 else a + diff * t
+
+
+def percentiles_from_hist(hist: np.ndarray, qs) -> np.ndarray:
+    """
+    Histogramdan np.percentile(img, qs) ile birebir aynı değerleri sıralama yapmadan bulur.
+    Sıralı dizinin i. elemanı, kümülatif histogramın i'yi ilk aştığı değerdir.
+    """
+    cum = np.cumsum(hist)
+    n = int(cum[-1])
+    if n == 0:
+        raise ValueError("Boş histogramdan yüzdelik hesaplanamaz")
+    out = []
+    for q in np.atleast_1d(qs):
+        virtual = (n - 1) * (np.float64(q) / 100)
+        prev = int(np.floor(virtual))
+        nxt = min(prev + 1, n - 1)
+        a = np.float64(np.searchsorted(cum, prev, side="right"))
+        b = np.float64(np.searchsorted(cum, nxt, side="right"))
+        out.append(_lerp(a, b, virtual - prev))
+    return np.array(out)
+
+
+def stretch_lut(lo_val: float, hi_val: float, bins: int) -> np.ndarray:
+    # auto_stretch ile aynı formül, her olası piksel değeri için bir kez
+    levels = np.arange(bins)
+    lut = (levels - lo_val) * 255.0 / (hi_val - lo_val)
+    return np.clip(lut, 0, 255).astype(np.uint8)
+
+
+def tiled_stretch(raster: np.ndarray, lo: float, hi: float, out: np.ndarray | None = None,
+                  tile_rows: int | None = None, hist: np.ndarray | None = None) -> np.ndarray:
+    """
+    Yüzdelik germeyi karo karo uygular: histogram → tam yüzdelikler → LUT → out[karo].
+    out verilmezse bellekte ayrılır; büyük sahneler için open_memmap ile açılmış bir dizi verin.
+    Alt ve üst yüzdelik eşitse görüntü değiştirilmeden kopyalanır (auto_stretch gibi).
+    """
+    if hist is None:
+        hist = tiled_histogram(raster, tile_rows)
+    lo_val, hi_val = percentiles_from_hist(hist, (lo, hi))
+    if hi_val == lo_val:
+        lut = None
+        dtype = raster.dtype
+    else:
+        lut = stretch_lut(lo_val, hi_val, len(hist))
+        dtype = np.uint8
+    if out is None:
+        out = np.empty(raster.shape, dtype=dtype)
+    for sl in iter_tiles(raster, tile_rows):
+        tile = np.asarray(raster[sl])
+        if lut is None:
+            out[sl] = tile
+        else:
+            np.take(lut, tile, out=out[sl])
+    return out
+
+
+def stretch_file(src: str, dst: str, lo: float, hi: float, tile_rows: int | None = None):
+    raster = open_raster(src)
+    hist = tiled_histogram(raster, tile_rows)
+    lo_val, hi_val = percentiles_from_hist(hist, (lo, hi))
+    dtype = raster.dtype if hi_val == lo_val else np.uint8
+    if dst.lower().endswith(".npy"):
+        out = np.lib.format.open_memmap(dst, mode="w+", dtype=dtype, shape=raster.shape)
+        tiled_stretch(raster, lo, hi, out=out, tile_rows=tile_rows, hist=hist)
+        out.flush()
+    else:
+        cv2.imwrite(dst, tiled_stretch(raster, lo, hi, tile_rows=tile_rows, hist=hist))
+    return hist, (lo_val, hi_val)
+
+
+def main():
+    p = argparse.ArgumentParser(description="Karo tabanlı histogram ve yüzdelik germe")
+    p.add_argument("src", help="Girdi raster (.npy belleğe eşlenir, diğerleri cv2 ile okunur)")
+    p.add_argument("dst", help="Çıktı (.npy karo karo yazılır)")
+    p.add_argument("--lo", type=float, default=5, help="Alt yüzdelik")
+    p.add_argument("--hi", type=float, default=95, help="Üst yüzdelik")
+    p.add_argument("--tile-rows", type=int, default=None, help="Bir karodaki satır sayısı")
+    args = p.parse_args()
+
+    hist, (lo_val, hi_val) = stretch_file(args.src, args.dst, args.lo, args.hi, args.tile_rows)
+    print(f"{os.path.basename(args.src)}: {int(hist.sum())} piksel, "
+          f"P{args.lo:g}={lo_val:.2f}, P{args.hi:g}={hi_val:.2f} → {args.dst}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+clahe() ile skimage.exposure.equalize_adapthist süre ve fark karşılaştırması.
+
+Kullanım
+-------
+$ python benchmark.py                         # 512, 2048, 4096 piksellik kareler
+$ python benchmark.py --sizes 1024 8192 --repeat 3
+"""
+import argparse
+import timeit
+
+import numpy as np
+from skimage import data, exposure
+from skimage.transform import resize
+from skimage.util import img_as_ubyte
+
+from clahe import clahe
+
+
+def scene(size):
+    # camera() görüntüsü büyütülüp hafif gürültü eklenerek tam çözünürlüklü sahne benzetilir
+    img = resize(data.camera(), (size, size), order=1, anti_aliasing=False)
+    rng = np.random.default_rng(0)
+    img = np.clip(img + rng.normal(0, 0.02, img.shape), 0, 1)
+    return img_as_ubyte(img)
+
+def main():
+    p = argparse.ArgumentParser(description="CLAHE karşılaştırması")
+    p.add_argument("--sizes", type=int, nargs="+", default=[512, 2048, 4096])
+    p.add_argument("--clip-limit", type=float, default=0.01)
+    p.add_argument("--repeat", type=int, default=1)
+    args = p.parse_args()
+
+    print(f"{'boyut':>7} {'clahe (s)':>10} {'skimage (s)':>12} {'hız':>6} {'ort. fark':>10}")
+    for size in args.sizes:
+        img = scene(size)
+        t_ours = min(timeit.repeat(lambda: clahe(img, clip_limit=args.clip_limit),
+                                   number=1, repeat=args.repeat))
+        t_sk = min(timeit.repeat(lambda: exposure.equalize_adapthist(img, clip_limit=args.clip_limit),
+                                 number=1, repeat=args.repeat))
+        ours = clahe(img, clip_limit=args.clip_limit).astype(np.float64) / 255
+        ref = exposure.equalize_adapthist(img, clip_limit=args.clip_limit)
+        diff = np.abs(ours - ref).mean() * 255
+        print(f"{size:>7} {t_ours:>10.3f} {t_sk:>12.3f} {t_sk / t_ours:>5.1f}x {diff:>10.2f}")
+
+if __name__ == "__main__":
+    main()
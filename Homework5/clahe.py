@@ -0,0 +1,98 @@
+import numpy as np
+
+from transforms import (LEVELS, calculate_histogram, calculate_cdf, dtype_max, image_levels,
+                        native_levels, output_dtype)
+
+BLOCK_PIXELS = 1 << 20      # enterpolasyonda bir seferde işlenen piksel sayısı
+CLAHE_BINS = 4096           # 8 bit dışı görüntülerde karo histogramı kutu sayısı (bellek: karo × kutu)
+
+
+def tile_shape(image_shape, kernel_size=None):
+    # skimage ile aynı varsayılan: her eksende görüntünün 1/8'i
+    h, w = image_shape
+    if kernel_size is None:
+        kernel_size = (max(1, h // 8), max(1, w // 8))
+    elif np.isscalar(kernel_size):
+        kernel_size = (int(kernel_size), int(kernel_size))
+    th, tw = (max(1, min(int(k), n)) for k, n in zip(kernel_size, (h, w)))
+    return th, tw
+
+def tile_histograms(padded, th, tw, levels=LEVELS):
+    """
+    (ty, tx, levels) boyutunda karo histogramları. Karolar reshape ile kopyasız görünüm
+    olarak alınır; bir karo satırındaki tüm karolar tek bir bincount ile sayılır
+    (karo indeksi * levels + piksel değeri). Kod dizisi yalnızca bir karo satırı boyundadır
+    ve satırlar arasında yeniden kullanılır; sığdığı sürece int32 tutulur.
+    """
+    ty, tx = padded.shape[0] // th, padded.shape[1] // tw
+    tiles = padded.reshape(ty, th, tx, tw)
+    code_dtype = np.int32 if tx * levels <= np.iinfo(np.int32).max else np.int64
+    offsets = (np.arange(tx, dtype=code_dtype) * levels)[None, :, None]
+    codes = np.empty((th, tx, tw), dtype=code_dtype)
+    hists = np.empty((ty, tx, levels), dtype=np.float64)
+    for i in range(ty):
+        np.add(tiles[i], offsets, out=codes)
+        hists[i] = calculate_histogram(codes, levels=tx * levels).reshape(tx, levels)
+    return hists
+
+def clip_histograms(hists, clip_limit, tile_pixels):
+    # Sınırı aşan sayımlar kesilir ve tüm seviyelere eşit olarak dağıtılır
+    clim = max(1.0, clip_limit * tile_pixels)
+    excess = np.maximum(hists - clim, 0).sum(axis=-1, keepdims=True)
+    np.minimum(hists, clim, out=hists)
+    hists += excess / hists.shape[-1]
+    return hists
+
+def _axis_weights(n, t, n_tiles):
+    # Her pikselin iki komşu karo merkezi ve ikincisine olan ağırlığı
+    f = np.clip((np.arange(n) + 0.5) / t - 0.5, 0, n_tiles - 1)
+    i0 = np.floor(f).astype(np.intp)
+    i1 = np.minimum(i0 + 1, n_tiles - 1)
+    return i0, i1, (f - i0).astype(np.float32)
+
+def clahe(image, kernel_size=None, clip_limit=0.01, bins=None, out_dtype=None):
+    """
+    Karo tabanlı uyarlamalı histogram eşitleme (CLAHE).
+    Her karo için kırpılmış histogramdan bir LUT üretilir; her piksel en yakın dört
+    karonun LUT değerlerinin çift doğrusal (bilinear) karışımıyla eşlenir.
+    clip_limit skimage.exposure.equalize_adapthist ile aynı anlamdadır (karo pikseline oran).
+    uint8 görüntüler 256 seviyede, uint16/float görüntüler veri aralığında bins
+    (varsayılan CLAHE_BINS) kutuda işlenir. Çıktı varsayılan olarak girdinin tipindedir.
+    """
+    image = np.asarray(image)
+    if image.ndim != 2:
+        raise ValueError("CLAHE için tek bantlı (2B) görüntü gerekli")
+    out_dtype = output_dtype(image.dtype) if out_dtype is None else np.dtype(out_dtype)
+    if bins is None and native_levels(image.dtype) != LEVELS:
+        bins = CLAHE_BINS
+    codes, values = image_levels(image, bins)
+    levels = len(values)
+    out_max = dtype_max(out_dtype)
+    h, w = codes.shape
+    th, tw = tile_shape(codes.shape, kernel_size)
+    ty, tx = -(-h // th), -(-w // tw)
+    pad = ((0, ty * th - h), (0, tx * tw - w))
+    padded = np.pad(codes, pad, mode='reflect') if pad[0][1] or pad[1][1] else codes
+
+    hists = tile_histograms(padded, th, tw, levels)
+    if clip_limit is not None and clip_limit > 0:
+        clip_histograms(hists, clip_limit, th * tw)
+    luts = (calculate_cdf(hists) * (out_max / (th * tw))).astype(np.float32)
+
+    y0, y1, wy = _axis_weights(h, th, ty)
+    x0, x1, wx = _axis_weights(w, tw, tx)
+    out = np.empty(codes.shape, dtype=out_dtype)
+    integer = np.issubdtype(out_dtype, np.integer)
+    step = max(1, BLOCK_PIXELS // w)
+    for r in range(0, h, step):
+        rows = slice(r, min(r + step, h))
+        v = codes[rows]
+        a0, a1 = y0[rows, None], y1[rows, None]
+        top = luts[a0, x0, v] * (1 - wx) + luts[a0, x1, v] * wx
+        bottom = luts[a1, x0, v] * (1 - wx) + luts[a1, x1, v] * wx
+        wr = wy[rows, None]
+        blended = top * (1 - wr) + bottom * wr
+        if integer:
+            np.rint(blended, out=blended)
+        out[rows] = np.clip(blended, 0, out_max)
+    return out
@@ -0,0 +1,148 @@
+import base64
+import html
+import io
+import os
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+
+from transforms import calculate_histogram, calculate_cdf, image_levels
+
+MAX_DISPLAY = 512           # görüntüler çizilmeden önce en uzun kenarı bu boyuta indirilir
+DISPLAY_BINS = 256          # histogram grafiklerinde en fazla kutu sayısı
+REPORT_DPI = 100
+
+
+def display_image(img, max_display=MAX_DISPLAY):
+    # Adımlı dilimleme ile kopyasız küçültme; ekranda zaten bu kadar piksel görünür
+    step = max(1, -(-max(img.shape[:2]) // max_display))
+    return img[::step, ::step]
+
+def display_histogram(hist, bins=DISPLAY_BINS):
+    # 65536 seviyeli histogramlar komşu kutular toplanarak çizim boyutuna indirilir
+    hist = np.asarray(hist)
+    if len(hist) <= bins:
+        return hist, 1
+    group = -(-len(hist) // bins)
+    return np.add.reduceat(hist, np.arange(0, len(hist), group)), group
+
+def scaled_cdf(hist, cdf=None):
+    # CDF histogramla aynı eksende görünsün diye tepe değerine ölçeklenir
+    cdf = calculate_cdf(hist) if cdf is None else cdf
+    if cdf.max() > 0 and hist.max() > 0:
+        return cdf * hist.max() / cdf.max()
+    return cdf
+
+def image_histogram(img):
+    codes, values = image_levels(img)
+    return calculate_histogram(codes, levels=len(values))
+
+def _hist_axis(ax, hist, cdf, title):
+    hist, group = display_histogram(hist)
+    if cdf is not None and group > 1:
+        # reduceat kutusu başına bir nokta: her kutunun son seviyesindeki CDF (son kutu eksik olabilir)
+        n = len(cdf)
+        cdf = cdf[np.minimum(np.arange(group - 1, n + group - 1, group), n - 1)]
+    xs = np.arange(len(hist)) * group
+    ax.plot(xs, hist, color='b', label='Histogram')
+    ax.plot(xs, scaled_cdf(hist, cdf), color='r', linestyle='--', label='CDF (Ölçekli)')
+    ax.set_title(title)
+    ax.set_xlim([0, len(hist) * group])
+    ax.legend()
+
+def comparison_figure(original_img, original_title, transformed_img, transformed_title,
+                      original_hist=None, transformed_hist=None,
+                      original_cdf=None, transformed_cdf=None, max_display=MAX_DISPLAY):
+    """
+    Orijinal / işlenmiş görüntü ve histogram + CDF karşılaştırma figürü (pyplot'suz, ekrana çizmez).
+    Histogram veya CDF verilmezse hesaplanır; görüntüler max_display'e küçültülerek çizilir.
+    """
+    if original_hist is None:
+        original_hist = image_histogram(original_img)
+    if transformed_hist is None:
+        transformed_hist = image_histogram(transformed_img)
+
+    fig = Figure(figsize=(12, 8))
+    ax = fig.subplots(2, 2).ravel()
+
+    ax[0].imshow(display_image(original_img, max_display), cmap='gray')
+    ax[0].set_title(f"Orijinal: {original_title}")
+    ax[0].axis('off')
+
+    ax[1].imshow(display_image(transformed_img, max_display), cmap='gray')
+    ax[1].set_title(f"İşlenmiş: {transformed_title}")
+    ax[1].axis('off')
+
+    _hist_axis(ax[2], original_hist, original_cdf, "Orijinal Histogram & CDF")
+    _hist_axis(ax[3], transformed_hist, transformed_cdf, "İşlenmiş Histogram & CDF")
+
+    fig.tight_layout()
+    return fig
+
+def image_figure(img, title, max_display=MAX_DISPLAY):
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots()
+    ax.imshow(display_image(img, max_display), cmap='gray')
+    ax.set_title(title)
+    ax.axis('off')
+    return fig
+
+def save_figure(fig, path, dpi=200):
+    FigureCanvasAgg(fig)
+    fig.savefig(path, dpi=dpi)
+
+
+class Report:
+    """
+    Bir çalıştırmanın tüm figürlerini tek dosyada toplar: .pdf (çok sayfalı) veya .html
+    (gömülü PNG'ler). Figürler eklendiği anda yazılır ve bellekte tutulmaz.
+    """
+
+    def __init__(self, path, dpi=REPORT_DPI, max_display=MAX_DISPLAY, title="Rapor"):
+        self.path = path
+        self.dpi = dpi
+        self.max_display = max_display
+        self.title = title
+        self.kind = os.path.splitext(path)[1].lower()
+        if self.kind not in (".pdf", ".html"):
+            raise ValueError(f"Rapor biçimi .pdf veya .html olmalı, gelen: {path}")
+        self._pdf = None
+        self._html = None
+
+    def __enter__(self):
+        if self.kind == ".pdf":
+            self._pdf = PdfPages(self.path)
+        else:
+            self._html = open(self.path, "w", encoding="utf-8")
+            self._html.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'>"
+                             f"<title>{html.escape(self.title)}</title></head><body>\n"
+                             f"<h1>{html.escape(self.title)}</h1>\n")
+        return self
+
+    def add_figure(self, fig, caption):
+        FigureCanvasAgg(fig)
+        if self._pdf is not None:
+            self._pdf.savefig(fig, dpi=self.dpi)
+        else:
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png", dpi=self.dpi)
+            data = base64.b64encode(buf.getvalue()).decode("ascii")
+            self._html.write(f"<h2>{html.escape(caption)}</h2>\n"
+                             f"<img src='data:image/png;base64,{data}'>\n")
+
+    def add_comparison(self, original_img, original_title, transformed_img, transformed_title, **hists):
+        fig = comparison_figure(original_img, original_title, transformed_img, transformed_title,
+                                max_display=self.max_display, **hists)
+        self.add_figure(fig, f"{original_title} → {transformed_title}")
+
+    def add_image(self, img, title):
+        self.add_figure(image_figure(img, title, self.max_display), title)
+
+    def __exit__(self, *exc):
+        if self._pdf is not None:
+            self._pdf.close()
+        if self._html is not None:
+            self._html.write("</body></html>\n")
+            self._html.close()
@@ -0,0 +1,172 @@
+import numpy as np
+
+LEVELS = 256
+FLOAT_BINS = 65536          # float (veya yeniden kutulanan) görüntüler için varsayılan kutu sayısı
+
+
+def calculate_histogram(image_gray_uint8, levels=LEVELS):
+    flat_image = image_gray_uint8.ravel()
+    hist = np.bincount(flat_image, minlength=levels)
+    return hist
+
+def calculate_cdf(hist, axis=-1):
+    cdf = hist.cumsum(axis=axis)
+    return cdf
+
+def apply_lut(image, lut, out=None):
+    # Yerinde LUT indeksleme: out verilirse yeni dizi ayrılmaz (karo/akış kullanımı için)
+    return np.take(lut, image, out=out)
+
+def transformed_histogram(hist, lut, levels=None):
+    # LUT uygulanmış görüntünün histogramı, görüntüye tekrar dokunmadan (tamsayı LUT için)
+    levels = native_levels(lut.dtype) if levels is None else levels
+    return np.bincount(lut, weights=hist, minlength=levels or 0).astype(np.int64)
+
+def native_levels(dtype):
+    # uint8/uint16 için doğal seviye sayısı; diğer tipler kutulanır (None)
+    dtype = np.dtype(dtype)
+    if dtype == np.uint8:
+        return LEVELS
+    if dtype == np.uint16:
+        return 65536
+    return None
+
+def dtype_max(dtype):
+    # Çıktı aralığının üst sınırı: tamsayılarda tipin en büyük değeri, float'ta 1.0
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        return np.iinfo(dtype).max
+    return 1.0
+
+def output_dtype(dtype):
+    # Varsayılan çıktı tipi: uint8/uint16 aynen, float aynen, diğerleri float64
+    dtype = np.dtype(dtype)
+    if native_levels(dtype) is not None or np.issubdtype(dtype, np.floating):
+        return dtype
+    return np.dtype(np.float64)
+
+def image_levels(image, bins=None, value_range=None):
+    """
+    Görüntüyü histogram seviyelerine çevirir: (codes, values).
+    uint8/uint16 görüntüler kopyasız olarak doğrudan kod kabul edilir (256 / 65536 seviye).
+    float, işaretli tamsayı veya farklı bir kutu sayısı istendiğinde değerler
+    [min, max] (veya value_range) aralığında bins kutuya doğrusal olarak yerleştirilir.
+    values[k], k. seviyenin görüntünün kendi birimindeki değeridir.
+    """
+    image = np.asarray(image)
+    native = native_levels(image.dtype)
+    if native is not None and (bins is None or bins == native):
+        return image, np.arange(native)
+
+    bins = FLOAT_BINS if bins is None else int(bins)
+    if value_range is None:
+        value_range = (image.min(), image.max()) if image.size else (0, 0)
+    lo, hi = (float(v) for v in value_range)
+    code_dtype = np.uint16 if bins <= 65536 else np.uint32
+    if hi <= lo:
+        return np.zeros(image.shape, dtype=code_dtype), np.full(1, lo)
+    scale = (bins - 1) / (hi - lo)
+    tmp = np.subtract(image, lo, dtype=np.float64)
+    tmp *= scale
+    np.rint(tmp, out=tmp)
+    np.clip(tmp, 0, bins - 1, out=tmp)
+    return tmp.astype(code_dtype), lo + np.arange(bins) / scale
+
+def convert_values(values, src_dtype, out_dtype):
+    # Yalnızca LUT (en fazla 65536 eleman) tip dönüştürülür, görüntünün kendisi değil
+    src_dtype, out_dtype = np.dtype(src_dtype), np.dtype(out_dtype)
+    if src_dtype == out_dtype:
+        return np.asarray(values).astype(out_dtype)
+    scaled = np.asarray(values, dtype=np.float64) * (dtype_max(out_dtype) / dtype_max(src_dtype))
+    if np.issubdtype(out_dtype, np.integer):
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, 0, dtype_max(out_dtype), out=scaled)
+    return scaled.astype(out_dtype)
+
+def equalization_lut(hist, out_dtype='uint8'):
+    """
+    Histogram eşitleme LUT'u. Maskeli dizi kullanmadan, sıfır olmayan en küçük CDF
+    değeri ile [0, dtype_max(out_dtype)] aralığına ölçekler; CDF'i sıfır olan seviyeler 0'a gider.
+    """
+    cdf = calculate_cdf(hist)
+    nonzero = np.flatnonzero(cdf)
+    if nonzero.size == 0 or cdf[-1] == cdf[nonzero[0]]:
+        return np.zeros(len(cdf), dtype=out_dtype)
+    cdf_min, cdf_max = cdf[nonzero[0]], cdf[-1]
+    lut = (cdf - cdf_min) * dtype_max(out_dtype) / (cdf_max - cdf_min)
+    lut[:nonzero[0]] = 0
+    return lut.astype(out_dtype)
+
+def equalize(image, out_dtype=None, bins=None, value_range=None):
+    """uint8, uint16 veya float görüntüyü kendi bit derinliğinde eşitler."""
+    image = np.asarray(image)
+    out_dtype = output_dtype(image.dtype) if out_dtype is None else np.dtype(out_dtype)
+    codes, values = image_levels(image, bins, value_range)
+    hist = calculate_histogram(codes, levels=len(values))
+    return apply_lut(codes, equalization_lut(hist, out_dtype))
+
+def matching_lut(source_cdf_norm, reference_cdf_norm):
+    # Her kaynak seviyesi için referans CDF'in onu ilk yakaladığı seviye (en fazla son seviye)
+    lut = np.searchsorted(reference_cdf_norm, source_cdf_norm, side='left')
+    return np.minimum(lut, len(reference_cdf_norm) - 1)
+
+
+class HistogramMatcher:
+    """
+    Referans görüntüye bir kez uydurulan histogram eşleştirme dönüşümü.
+    Referans CDF'i saklanır; her kaynak için yalnızca kaynağın histogramı ve
+    searchsorted ile LUT hesaplanır, dönüşüm LUT indekslemeyle uygulanır.
+    uint8/uint16 kendi seviyeleriyle, float görüntüler bins kutuyla işlenir;
+    çıktı varsayılan olarak referansın tipindedir.
+    """
+
+    def __init__(self, reference_image=None, reference_hist=None, reference_values=None, bins=None):
+        self.bins = bins
+        self.reference_cdf_norm = None
+        self.reference_values = None
+        self.reference_dtype = None
+        if reference_image is not None or reference_hist is not None:
+            self.fit(reference_image, reference_hist, reference_values)
+
+    def fit(self, reference_image=None, reference_hist=None, reference_values=None):
+        if reference_hist is None:
+            if reference_image is None:
+                raise ValueError("Referans görüntü veya histogram verilmeli")
+            reference_image = np.asarray(reference_image)
+            codes, reference_values = image_levels(reference_image, self.bins)
+            reference_hist = calculate_histogram(codes, levels=len(reference_values))
+            self.reference_dtype = output_dtype(reference_image.dtype)
+        else:
+            if reference_values is None:
+                reference_values = np.arange(len(reference_hist))
+            self.reference_dtype = np.dtype(np.uint8 if len(reference_hist) <= LEVELS else np.uint16)
+        reference_pixels = max(1, int(np.sum(reference_hist)))
+        self.reference_cdf_norm = calculate_cdf(reference_hist) / reference_pixels
+        self.reference_values = np.asarray(reference_values)
+        return self
+
+    def lut(self, source_hist, out_dtype=None):
+        if self.reference_cdf_norm is None:
+            raise ValueError("HistogramMatcher önce fit() ile referansa uydurulmalı")
+        out_dtype = self.reference_dtype if out_dtype is None else out_dtype
+        source_pixels = max(1, int(np.sum(source_hist)))
+        source_cdf_norm = calculate_cdf(source_hist) / source_pixels
+        levels = matching_lut(source_cdf_norm, self.reference_cdf_norm)
+        return convert_values(self.reference_values[levels], self.reference_dtype, out_dtype)
+
+    def transform(self, source_image, out=None, source_hist=None, value_range=None, out_dtype=None):
+        """
+        Kaynağı referansa eşler. Büyük bir sahnenin karoları için sahnenin toplam
+        histogramını source_hist olarak verin; böylece tüm karolar aynı LUT'u kullanır
+        (float sahnelerde aynı kutulama için value_range de verilmeli).
+        """
+        if out_dtype is None and out is not None:
+            out_dtype = out.dtype
+        codes, values = image_levels(source_image, self.bins, value_range)
+        if source_hist is None:
+            source_hist = calculate_histogram(codes, levels=len(values))
+        return apply_lut(codes, self.lut(source_hist, out_dtype), out=out)
+
+    def transform_many(self, source_images):
+        for source_image in source_images:
+            yield self.transform(source_image)
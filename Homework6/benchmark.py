@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+apply_convolution arka uçlarının k=3..101 için süre karşılaştırması.
+
+Kullanım
+-------
+$ python benchmark.py                              # 512x512, k = 3, 5, 9, 15, 25, 51, 101
+$ python benchmark.py --size 2048 --max-direct 25  # büyük görüntüde yavaş dense yolu k<=25 ile sınırla
+$ python benchmark.py --dtypes --size 4096         # float64 / float32 / tamsayı yolu: süre ve tepe bellek
+"""
+import argparse
+import timeit
+import tracemalloc
+
+import numpy as np
+from scipy import ndimage as ndi
+from skimage import data, util
+from skimage.transform import resize
+
+import filters
+from filterbank import SOBEL_X_WEIGHTS
+from main import apply_convolution
+
+K_SIZES = [3, 5, 9, 15, 25, 51, 101]
+
+
+def best(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+def peak_memory(fn):
+    # numpy ayırmaları tracemalloc'a bildirilir; girdi hariç ek tepe bellek
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+def dtype_benchmark(img, repeat):
+    u8 = util.img_as_ubyte(img)
+    cases = [
+        ("box k=5", {
+            "float64": lambda: apply_convolution(u8, 'box', 5),
+            "float32": lambda: apply_convolution(u8, 'box', 5, dtype=np.float32),
+            "int": lambda: apply_convolution(u8, 'box', 5, integer=True)}),
+        ("gaussian k=5", {
+            "float64": lambda: apply_convolution(u8, 'gaussian', 5),
+            "float32": lambda: apply_convolution(u8, 'gaussian', 5, dtype=np.float32)}),
+        ("laplacian", {
+            "float64": lambda: apply_convolution(u8, 'laplacian'),
+            "float32": lambda: apply_convolution(u8, 'laplacian', dtype=np.float32),
+            "int": lambda: apply_convolution(u8, 'laplacian', integer=True)}),
+        ("sobel x", {
+            "float64": lambda: ndi.convolve(util.img_as_float(u8), SOBEL_X_WEIGHTS, mode='reflect'),
+            "float32": lambda: ndi.convolve(util.img_as_float32(u8), SOBEL_X_WEIGHTS, mode='reflect'),
+            "int": lambda: filters.sobel_int(u8, axis=1)}),
+    ]
+    ref_scale = {"box k=5": 255, "gaussian k=5": 255, "laplacian": 255, "sobel x": 4 * 255}
+    print(f"görüntü {u8.shape[0]}x{u8.shape[1]} uint8; süre ms, ek tepe bellek MB, float64'e göre en büyük fark (gri seviye)")
+    for title, variants in cases:
+        ref = variants["float64"]()
+        for kind, fn in variants.items():
+            t = best(fn, repeat)
+            mem = peak_memory(fn) / 2 ** 20
+            res = fn()
+            scale = ref_scale[title] if kind == "int" else 1
+            diff = np.abs(res / scale - ref).max() * 255
+            print(f"{title:>13} {kind:>8}: {t * 1e3:8.1f} ms {mem:8.1f} MB  fark {diff:.2e}")
+
+def main():
+    p = argparse.ArgumentParser(description="Konvolüsyon arka uçları karşılaştırması")
+    p.add_argument("--size", type=int, default=512, help="Kare test görüntüsünün kenarı")
+    p.add_argument("--k", type=int, nargs="+", default=K_SIZES, help="Çekirdek boyutları")
+    p.add_argument("--max-direct", type=int, default=51, help="Dense ndi.convolve'un ölçüleceği en büyük k")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--dtypes", action="store_true", help="float64 / float32 / tamsayı yollarını karşılaştır")
+    args = p.parse_args()
+
+    img = util.img_as_float(resize(data.camera(), (args.size, args.size), order=1))
+    if args.dtypes:
+        dtype_benchmark(img, args.repeat)
+        return
+    rng = np.random.default_rng(0)
+
+    print(f"görüntü {args.size}x{args.size}, süreler ms; 'auto' = ayrılamayan rastgele çekirdekte seçilen yol")
+    print(f"{'k':>4} | {'box dense':>10} {'uniform':>8} {'separable':>9} {'fft':>8} | "
+          f"{'rnd dense':>10} {'rnd fft':>8} {'auto':>9} | {'max fark':>9}")
+    for k in args.k:
+        box = np.ones((k, k)) / (k * k)
+        rnd = rng.random((k, k))
+        dense = k <= args.max_direct
+        ref = ndi.convolve(img, box, mode='reflect') if dense else filters.box_filter(img, k)
+        diff = max(np.abs(filters.box_filter(img, k) - ref).max(),
+                   np.abs(filters.convolve(img, box, method='separable') - ref).max(),
+                   np.abs(filters.convolve(img, box, method='fft') - ref).max())
+
+        t = {
+            "box dense": best(lambda: ndi.convolve(img, box, mode='reflect'), args.repeat) if dense else None,
+            "uniform": best(lambda: filters.box_filter(img, k), args.repeat),
+            "separable": best(lambda: filters.convolve(img, box, method='separable'), args.repeat),
+            "fft": best(lambda: filters.convolve(img, box, method='fft'), args.repeat),
+            "rnd dense": best(lambda: ndi.convolve(img, rnd, mode='reflect'), args.repeat) if dense else None,
+            "rnd fft": best(lambda: filters.convolve(img, rnd, method='fft'), args.repeat),
+        }
+        fmt = lambda v, w: f"{'-':>{w}}" if v is None else f"{v * 1e3:>{w}.1f}"
+        print(f"{k:>4} | {fmt(t['box dense'], 10)} {fmt(t['uniform'], 8)} {fmt(t['separable'], 9)} "
+              f"{fmt(t['fft'], 8)} | {fmt(t['rnd dense'], 10)} {fmt(t['rnd fft'], 8)} "
+              f"{filters.choose_method(rnd, img.shape):>9} | {diff:>9.1e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+import numpy as np
+from scipy import ndimage as ndi
+from skimage import color, util
+from skimage.feature import canny as _canny
+
+import filters
+
+# skimage.filters ile aynı ağırlıklar (edges.py)
+EDGE_WEIGHTS = np.array([1.0, 0.0, -1.0])
+SOBEL_SMOOTH = np.array([1.0, 2.0, 1.0]) / 4
+PREWITT_SMOOTH = np.full(3, 1 / 3)
+SOBEL_X_WEIGHTS = SOBEL_SMOOTH[:, None] * EDGE_WEIGHTS[None, :]     # sobel_v
+SOBEL_Y_WEIGHTS = SOBEL_X_WEIGHTS.T                                 # sobel_h
+PREWITT_X_WEIGHTS = PREWITT_SMOOTH[:, None] * EDGE_WEIGHTS[None, :]
+PREWITT_Y_WEIGHTS = PREWITT_X_WEIGHTS.T
+ROBERTS_PD_WEIGHTS = np.array([[1.0, 0.0], [0.0, -1.0]])
+ROBERTS_ND_WEIGHTS = np.array([[0.0, 1.0], [-1.0, 0.0]])
+LAPLACE_WEIGHTS = np.array([[0.0, -1.0, 0.0], [-1.0, 4.0, -1.0], [0.0, -1.0, 0.0]])
+
+OUTPUTS = ("box", "gaussian", "laplacian", "grad_x", "grad_y", "magnitude", "orientation",
+           "roberts", "prewitt", "sobel", "log", "canny")
+
+
+def as_gray_float(image, dtype=np.float32):
+    # rgb2gray + img_as_float tek seferde; float32 için uint8'den doğrudan dönüşüm (float64 ara kopya yok)
+    if image.ndim > 2:
+        return color.rgb2gray(image).astype(dtype, copy=False)
+    if np.dtype(dtype) == np.float32:
+        return util.img_as_float32(image)
+    return util.img_as_float(image).astype(dtype, copy=False)
+
+
+class FilterBank:
+    """
+    Bir görüntü için ortak ön işleme ve ara sonuç önbelleği.
+    Gri/float dönüşümü bir kez yapılır; Gauss ile yumuşatılmış görüntüler (sigma, mod
+    başına) ve Sobel x/y yanıtları saklanır, böylece gradyanlar, Sobel kenarı ve LoG
+    aynı ara sonuçlardan üretilir. Sonuçlar skimage.filters karşılıklarıyla aynıdır
+    (dtype=np.float64 ile birebir, float32 ile yuvarlama farkı kadar).
+    """
+
+    def __init__(self, image, dtype=np.float32):
+        self.dtype = np.dtype(dtype)
+        self.image = as_gray_float(np.asarray(image), self.dtype)
+        self._cache = {}
+
+    def _empty(self, out=None):
+        return np.empty(self.image.shape, dtype=self.dtype) if out is None else out
+
+    def _cached(self, key, fn):
+        if key not in self._cache:
+            self._cache[key] = fn()
+        return self._cache[key]
+
+    def smoothed(self, sigma, mode='nearest'):
+        # skimage.filters.gaussian'ın varsayılan modu 'nearest'
+        return self._cached(("gauss", float(sigma), mode),
+                            lambda: filters.gaussian_filter(self.image, sigma, mode=mode))
+
+    def sobel_xy(self):
+        # (grad_x, grad_y) = (sobel_v, sobel_h). 3×3'te ayrılabilir geçiş kazandırmaz; skimage ile
+        # aynı çekirdek kullanılır ki yönelimde ±0 işaretleri (arctan2'de ±π) birebir tutsun
+        def compute():
+            gx = ndi.convolve(self.image, SOBEL_X_WEIGHTS, mode='reflect', output=self._empty())
+            gy = ndi.convolve(self.image, SOBEL_Y_WEIGHTS, mode='reflect', output=self._empty())
+            return gx, gy
+        return self._cached("sobel_xy", compute)
+
+    def _sobel_norm(self):
+        # sqrt(gx² + gy²): hem gradyan büyüklüğü hem Sobel kenarı bundan türetilir
+        def compute():
+            gx, gy = self.sobel_xy()
+            return np.hypot(gx, gy, out=self._empty())
+        return self._cached("sobel_norm", compute)
+
+    def box(self, k_size=3, mode='reflect', out=None):
+        return filters.box_filter(self.image, k_size, mode=mode, output=self._empty(out))
+
+    def gaussian(self, sigma=1.0, mode='nearest', out=None):
+        if out is None:
+            return self.smoothed(sigma, mode)
+        out[...] = self.smoothed(sigma, mode)
+        return out
+
+    def laplacian(self, out=None, image=None):
+        image = self.image if image is None else image
+        return ndi.convolve(image, LAPLACE_WEIGHTS, mode='reflect', output=self._empty(out))
+
+    def grad_x(self, out=None):
+        return self._copy(self.sobel_xy()[0], out)
+
+    def grad_y(self, out=None):
+        return self._copy(self.sobel_xy()[1], out)
+
+    def magnitude(self, out=None):
+        # calculate_gradients ile aynı: en büyük değere bölünmüş büyüklük
+        out = self._copy(self._sobel_norm(), out)
+        max_mag = out.max()
+        if max_mag > np.finfo(float).eps:
+            out /= max_mag
+        return out
+
+    def orientation(self, out=None):
+        gx, gy = self.sobel_xy()
+        return np.arctan2(gy, gx, out=self._empty(out))
+
+    def sobel(self, out=None):
+        out = self._copy(self._sobel_norm(), out)
+        out /= np.sqrt(2, dtype=self.dtype)
+        return out
+
+    def prewitt(self, out=None):
+        px = ndi.convolve(self.image, PREWITT_X_WEIGHTS, mode='reflect')
+        out = ndi.convolve(self.image, PREWITT_Y_WEIGHTS, mode='reflect', output=self._empty(out))
+        np.hypot(out, px, out=out)
+        out /= np.sqrt(2, dtype=self.dtype)
+        return out
+
+    def roberts(self, out=None):
+        pd = ndi.convolve(self.image, ROBERTS_PD_WEIGHTS)
+        out = ndi.convolve(self.image, ROBERTS_ND_WEIGHTS, output=self._empty(out))
+        np.hypot(out, pd, out=out)
+        out /= np.sqrt(2)
+        return out
+
+    def log(self, sigma=1.0, out=None):
+        return self.laplacian(out, image=self.smoothed(sigma))
+
+    def canny(self, sigma=1.0, low_threshold=None, high_threshold=None, out=None):
+        # Canny kendi maskeli yumuşatmasını ve histerezisini yapar; yalnızca dönüşüm paylaşılır
+        edges = _canny(self.image, sigma=sigma, low_threshold=low_threshold, high_threshold=high_threshold)
+        if out is None:
+            return edges
+        out[...] = edges
+        return out
+
+    def _copy(self, src, out=None):
+        out = self._empty(out)
+        np.copyto(out, src)
+        return out
+
+    def compute(self, requests):
+        """
+        requests: {başlık: (çıktı adı, parametreler)} — ör. {"Sobel": ("sobel", {})}.
+        Tüm float çıktı tamponları hesaplamadan önce ayrılır; ortak ara sonuçlar bir kez hesaplanır.
+        """
+        for name, _ in requests.values():
+            if name not in OUTPUTS:
+                raise ValueError(f"Bilinmeyen çıktı: {name}. Seçenekler: {', '.join(OUTPUTS)}")
+        buffers = {title: None if name == "canny" else np.empty(self.image.shape, dtype=self.dtype)
+                   for title, (name, _) in requests.items()}
+        return {title: getattr(self, name)(out=buffers[title], **params)
+                for title, (name, params) in requests.items()}
+
+    def gradients(self):
+        return self.compute({
+            "grad_x": ("grad_x", {}),
+            "grad_y": ("grad_y", {}),
+            "magnitude": ("magnitude", {}),
+            "orientation": ("orientation", {}),
+        })
+
+    def edges(self, log_sigma=1.0, canny_sigma=1.0):
+        # apply_edge_detectors ile aynı başlıklar
+        return self.compute({
+            'Roberts': ("roberts", {}),
+            'Prewitt': ("prewitt", {}),
+            'Sobel': ("sobel", {}),
+            'LoG (Sigma={})'.format(log_sigma): ("log", {"sigma": log_sigma}),
+            'Canny (Sigma={})'.format(canny_sigma): ("canny", {"sigma": canny_sigma}),
+        })
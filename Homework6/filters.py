@@ -0,0 +1,174 @@
+import numpy as np
+from scipy import ndimage as ndi
+from scipy.signal import fftconvolve
+
+METHODS = ("auto", "direct", "separable", "fft")
+FFT_MIN_TAPS = 9 * 9            # ayrılamayan çekirdeklerde bu kadar katsayıdan sonra FFT
+SEPARABLE_RTOL = 1e-10          # çekirdek rank-1 sayılırken ikinci tekil değerin izin verilen oranı
+GAUSS_TRUNCATE = 4.0            # skimage.filters.gaussian / ndi.gaussian_filter varsayılanı
+
+# ndi sınır modlarının np.pad karşılıkları (FFT yolu için)
+PAD_MODES = {
+    "reflect": "symmetric",
+    "mirror": "reflect",
+    "nearest": "edge",
+    "wrap": "wrap",
+    "constant": "constant",
+}
+
+
+def box_filter(image, k_size, mode='reflect', cval=0.0, output=None):
+    # Kayan toplam (uniform_filter): her eksende bir geçiş, k'dan bağımsız olarak piksel başına O(1)
+    return ndi.uniform_filter(image, size=k_size, mode=mode, cval=cval, output=output)
+
+def separable_filter(image, col_kernel, row_kernel, mode='reflect', cval=0.0, output=None):
+    # k×k yerine iki 1-B geçiş: piksel başına O(2k)
+    tmp = ndi.convolve1d(image, col_kernel, axis=0, mode=mode, cval=cval)
+    return ndi.convolve1d(tmp, row_kernel, axis=1, mode=mode, cval=cval, output=output)
+
+def gaussian_filter(image, sigma, mode='reflect', cval=0.0, truncate=GAUSS_TRUNCATE, output=None):
+    # Ayrılabilir Gauss; skimage.filters.gaussian'ın float görüntüde verdiği sonuçla aynı
+    return ndi.gaussian_filter(image, sigma=sigma, mode=mode, cval=cval, truncate=truncate, output=output)
+
+def fft_convolve(image, kernel, mode='reflect', cval=0.0):
+    """
+    Büyük, ayrılamayan çekirdekler için FFT konvolüsyonu. Görüntü ndi ile aynı sınır
+    kuralıyla çekirdek yarıçapı kadar doldurulur, 'valid' sonuç ndi.convolve ile aynı hizadadır.
+    """
+    kernel = np.asarray(kernel, dtype=float)
+    if any(n % 2 == 0 for n in kernel.shape):
+        raise ValueError("FFT yolu tek boyutlu (3, 5, 7, ...) çekirdek gerektirir")
+    if mode not in PAD_MODES:
+        raise ValueError(f"Desteklenmeyen sınır modu: {mode}")
+    pad = [(n // 2, n // 2) for n in kernel.shape]
+    if mode == "constant":
+        padded = np.pad(image, pad, mode="constant", constant_values=cval)
+    else:
+        padded = np.pad(image, pad, mode=PAD_MODES[mode])
+    return fftconvolve(padded, kernel, mode='valid')
+
+def separate(kernel):
+    # Rank-1 çekirdeği (sütun, satır) 1-B çekirdeklerine ayırır; ayrılamıyorsa None
+    kernel = np.asarray(kernel, dtype=float)
+    if kernel.ndim != 2 or min(kernel.shape) == 1:
+        return None
+    u, s, vt = np.linalg.svd(kernel)
+    if s[0] == 0 or s[1] > SEPARABLE_RTOL * s[0]:
+        return None
+    scale = np.sqrt(s[0])
+    return u[:, 0] * scale, vt[0] * scale
+
+def choose_method(kernel, image_shape):
+    """Çekirdek boyutu ve şekline göre en ucuz yöntem: separable, fft veya direct."""
+    kernel = np.asarray(kernel)
+    if separate(kernel) is not None:
+        return "separable"
+    if kernel.size >= FFT_MIN_TAPS and all(n % 2 for n in kernel.shape) \
+            and min(image_shape) >= max(kernel.shape):
+        return "fft"
+    return "direct"
+
+def convolve(image, kernel, mode='reflect', cval=0.0, method='auto'):
+    """
+    ndi.convolve(image, kernel, mode=mode) ile aynı sonucu veren 2-B konvolüsyon.
+    method='auto' çekirdeğe göre ayrılabilir 1-B geçişler, FFT veya doğrudan yöntemi seçer.
+    """
+    if method not in METHODS:
+        raise ValueError(f"method {METHODS} içinden biri olmalı, gelen: {method}")
+    if method == "auto":
+        method = choose_method(kernel, image.shape)
+    if method == "separable":
+        parts = separate(kernel)
+        if parts is None:
+            raise ValueError("Çekirdek ayrılabilir (rank-1) değil")
+        return separable_filter(image, *parts, mode=mode, cval=cval)
+    if method == "fft":
+        return fft_convolve(image, kernel, mode=mode, cval=cval)
+    return ndi.convolve(image, kernel, mode=mode, cval=cval)
+
+
+# --- Tamsayı hızlı yolu: uint8/uint16 girdiler, int16/int32 biriktirici ---
+
+def accumulator_dtype(dtype, gain):
+    """Girdinin en büyük değeri × gain taşmadan sığan en küçük işaretli tamsayı tipi."""
+    peak = int(np.iinfo(dtype).max) * int(gain)
+    for acc in (np.int16, np.int32, np.int64):
+        if peak <= np.iinfo(acc).max:
+            return np.dtype(acc)
+    raise ValueError(f"{dtype} için biriktirici bulunamadı (kazanç {gain})")
+
+def _check_int(image):
+    if image.dtype not in (np.uint8, np.uint16) or image.ndim != 2:
+        raise ValueError(f"Tamsayı yolu tek bantlı uint8/uint16 görüntü gerektirir, gelen: {image.dtype}, {image.ndim}B")
+
+def _pad(image, radius, mode, cval=0):
+    if mode not in PAD_MODES:
+        raise ValueError(f"Desteklenmeyen sınır modu: {mode}")
+    if mode == "constant":
+        return np.pad(image, radius, mode="constant", constant_values=cval)
+    return np.pad(image, radius, mode=PAD_MODES[mode])
+
+def box_sum_int(image, k_size, mode='reflect', acc=None):
+    """
+    k×k pencere toplamları, tamsayı kümülatif toplamlarla (piksel başına O(1)).
+    Kümülatif toplam taşsa bile (modüler aritmetik) pencere farkı doğrudur; yeter ki
+    pencere toplamı acc tipine sığsın.
+    """
+    _check_int(image)
+    if k_size % 2 == 0:
+        raise ValueError("Tamsayı kutu filtresi tek boyutlu pencere gerektirir")
+    acc = accumulator_dtype(image.dtype, k_size * k_size) if acc is None else np.dtype(acc)
+    padded = _pad(image, k_size // 2, mode)
+    h, w = image.shape
+    sums = np.zeros((padded.shape[0] + 1, padded.shape[1]), dtype=acc)
+    np.cumsum(padded, axis=0, dtype=acc, out=sums[1:])
+    rows = sums[k_size:] - sums[:-k_size]
+    sums = np.zeros((h, rows.shape[1] + 1), dtype=acc)
+    np.cumsum(rows, axis=1, dtype=acc, out=sums[:, 1:])
+    return sums[:, k_size:] - sums[:, :-k_size]
+
+def box_filter_int(image, k_size, mode='reflect', out=None):
+    # Yuvarlanmış ortalama, girdiyle aynı tipte: (toplam + n/2) // n
+    n = k_size * k_size
+    sums = box_sum_int(image, k_size, mode, acc=accumulator_dtype(image.dtype, n + 1))
+    sums += n // 2
+    sums //= n
+    if out is None:
+        return sums.astype(image.dtype)
+    np.copyto(out, sums, casting='unsafe')
+    return out
+
+def _edge_int(image, axis, smooth, mode, out):
+    # Kenar [1, 0, -1] (konvolüsyon yönünde) × yumuşatma; 3×3 kaydırılmış dilimlerle
+    _check_int(image)
+    acc = accumulator_dtype(image.dtype, sum(smooth))
+    p = _pad(image, 1, mode).astype(acc)
+    if axis == 0:
+        d = p[2:] - p[:-2]
+        s = smooth[0] * d[:, :-2] + smooth[1] * d[:, 1:-1] + smooth[2] * d[:, 2:]
+    else:
+        d = p[:, 2:] - p[:, :-2]
+        s = smooth[0] * d[:-2] + smooth[1] * d[1:-1] + smooth[2] * d[2:]
+    if out is None:
+        return s
+    np.copyto(out, s, casting='unsafe')
+    return out
+
+def sobel_int(image, axis, mode='reflect', out=None):
+    """Ölçeksiz Sobel yanıtı; float yol = sobel_int / (4 · girdi tipinin en büyük değeri)."""
+    return _edge_int(image, axis, (1, 2, 1), mode, out)
+
+def prewitt_int(image, axis, mode='reflect', out=None):
+    """Ölçeksiz Prewitt yanıtı; float yol = prewitt_int / (3 · girdi tipinin en büyük değeri)."""
+    return _edge_int(image, axis, (1, 1, 1), mode, out)
+
+def laplacian_int(image, mode='reflect', out=None):
+    """4-komşu Laplace (merkez +4); float yol = laplacian_int / girdi tipinin en büyük değeri."""
+    _check_int(image)
+    acc = accumulator_dtype(image.dtype, 4)
+    p = _pad(image, 1, mode).astype(acc)
+    res = 4 * p[1:-1, 1:-1] - p[:-2, 1:-1] - p[2:, 1:-1] - p[1:-1, :-2] - p[1:-1, 2:]
+    if out is None:
+        return res
+    np.copyto(out, res, casting='unsafe')
+    return out
@@ -1,89 +1,145 @@
+#!/usr/bin/env python3
+"""
+Kullanım
+-------
+$ python main.py                                          # camera, moon, coins; (a)(b)(c) + grafikler
+$ python main.py sahne1.tif sahne2.png --stages b c --jobs 4
+$ python main.py img/*.png --no-plots --format tif        # yalnızca sayısal çıktılar (float32 yazılır)
+$ python main.py sahne.tif --dtype float32                # hesap da float32 (daha az bellek, daha düşük hassasiyet)
+"""
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
-import matplotlib.pyplot as plt
-from skimage import data, io, color, util
+from skimage import data, io
 from skimage.filters import gaussian, laplace
-from skimage.filters import roberts, prewitt, sobel, sobel_v, sobel_h
-from skimage.feature import canny
 from scipy import ndimage as ndi
-import os 
-
-OUTPUT_DIR = "outputs"
 
-os.makedirs(OUTPUT_DIR, exist_ok=True) 
+import filters
+from filterbank import FilterBank, LAPLACE_WEIGHTS, as_gray_float
 
-def apply_convolution(image, filter_type='box', k_size=3, padding_mode='reflect', **kwargs):
-    if image.ndim > 2:
-        image = color.rgb2gray(image)
-    image = util.img_as_float(image)
+OUTPUT_DIR = "outputs"
+SAMPLE_IMAGES = ['camera', 'moon', 'coins']     # skimage.data örnekleri
+STAGES = ('a', 'b', 'c')                        # konvolüsyon, gradyan, kenar
+FORMATS = ('npy', 'tif')
+TIF_TILE = (256, 256)                           # tif çıktılarında karo boyutu
+DTYPES = {'float64': np.float64, 'float32': np.float32}    # hesap tipi; yazılan dosyalar her zaman float32
+
+def apply_convolution(image, filter_type='box', k_size=3, padding_mode='reflect', method='auto', bank=None,
+                      dtype=np.float64, integer=False, out=None, **kwargs):
+    """
+    dtype: float yolunun çalışma tipi (np.float32 belleği ve bant genişliğini yarıya indirir).
+    integer=True: uint8/uint16 girdide box (yuvarlanmış ortalama, girdi tipinde) ve Laplace
+    (int16/int32) float'a hiç çevrilmeden hesaplanır; Sobel/Prewitt için calculate_gradients ve
+    apply_edge_detectors'a bakın. out: sonucun yazılacağı hazır tampon.
+    bank yalnızca kendi dtype'ı istenen dtype ile aynıysa kullanılır; değilse görüntü istenen
+    tipte yeniden dönüştürülür (float32 bankadan float64 sonuç üretilmez).
+    """
+    if integer:
+        if filter_type == 'box':
+            return filters.box_filter_int(image, k_size + 1 - k_size % 2, mode=padding_mode, out=out)
+        if filter_type == 'laplacian':
+            return filters.laplacian_int(image, mode=padding_mode, out=out)
+        raise ValueError("Tamsayı yolu apply_convolution'da yalnızca 'box' ve 'laplacian' için; "
+                         "Gauss için dtype=np.float32, Sobel/Prewitt için calculate_gradients / "
+                         "apply_edge_detectors(integer=True) kullanın.")
+
+    if bank is not None and bank.dtype == np.dtype(dtype):
+        # Dönüşüm FilterBank'te bir kez yapıldı
+        image = bank.image
+    else:
+        image = as_gray_float(image, dtype)
 
     if filter_type == 'box':
         if k_size % 2 == 0:
             k_size += 1
+        if method == 'auto':
+            # Kayan toplam: k'dan bağımsız, dense k×k konvolüsyonla aynı sonuç
+            return filters.box_filter(image, k_size, mode=padding_mode, output=out)
         kernel = np.ones((k_size, k_size)) / (k_size * k_size)
-        return ndi.convolve(image, kernel, mode=padding_mode)
+        res = filters.convolve(image, kernel, mode=padding_mode, method=method)
+        return res if out is None else _store(res, out)
 
     elif filter_type == 'gaussian':
         sigma = (k_size - 1) / 6.0 if k_size > 1 else 1
-        return gaussian(image, sigma=sigma, mode=padding_mode, **kwargs)
+        if kwargs:
+            res = gaussian(image, sigma=sigma, mode=padding_mode, **kwargs)
+            return res if out is None else _store(res, out)
+        return filters.gaussian_filter(image, sigma, mode=padding_mode, output=out)
 
     elif filter_type == 'laplacian':
-        return laplace(image, ksize=3, **kwargs)
-
-    else:
-        raise ValueError("Desteklenmeyen filtre tipi. 'box', 'gaussian' veya 'laplacian' kullanın.")
-
-def calculate_gradients(image):
-    if image.ndim > 2:
-        image = color.rgb2gray(image)
-    image = util.img_as_float(image)
-
-    grad_x = sobel_v(image)
-    grad_y = sobel_h(image)
-
-    magnitude = np.sqrt(grad_x**2 + grad_y**2)
-    max_mag = np.max(magnitude)
-    if max_mag > np.finfo(float).eps:
-         magnitude = magnitude / max_mag
-
-    orientation = np.arctan2(grad_y, grad_x)
-
-    return grad_x, grad_y, magnitude, orientation
-
-def apply_edge_detectors(image, log_sigma=1.0, canny_sigma=1.0):
-    if image.ndim > 2:
-        image = color.rgb2gray(image)
-    image = util.img_as_float(image)
+        if kwargs:
+            res = laplace(image, ksize=3, **kwargs)
+            return res if out is None else _store(res, out)
+        # skimage.filters.laplace ile aynı çekirdek ve sınır kuralı, doğrudan out'a
+        return ndi.convolve(image, LAPLACE_WEIGHTS, mode='reflect', output=out)
 
-    edges = {}
-    edges['Roberts'] = roberts(image)
-    edges['Prewitt'] = prewitt(image)
-    edges['Sobel'] = sobel(image)
-
-    im_gaussian = gaussian(image, sigma=log_sigma)
-    edges['LoG (Sigma={})'.format(log_sigma)] = laplace(im_gaussian)
-
-    edges['Canny (Sigma={})'.format(canny_sigma)] = canny(image, sigma=canny_sigma)
+    elif filter_type == 'custom':
+        # Rastgele çekirdek: ayrılabilirse 1-B geçişler, büyükse FFT, değilse doğrudan
+        res = filters.convolve(image, kwargs['kernel'], mode=padding_mode, method=method)
+        return res if out is None else _store(res, out)
 
+    else:
+        raise ValueError("Desteklenmeyen filtre tipi. 'box', 'gaussian', 'laplacian' veya 'custom' kullanın.")
+
+def _store(res, out):
+    np.copyto(out, res, casting='same_kind')
+    return out
+
+def calculate_gradients(image, bank=None, integer=False):
+    """
+    integer=True: uint8/uint16 girdide grad_x / grad_y ölçeksiz tamsayı Sobel yanıtlarıdır
+    (float yol × 4 · tipin en büyük değeri, birebir); büyüklük ve yönelim bunlardan hesaplanır.
+    """
+    if integer:
+        gx = filters.sobel_int(image, axis=1)
+        gy = filters.sobel_int(image, axis=0)
+        mag = np.hypot(gx, gy, dtype=np.float64)
+        max_mag = mag.max()
+        if max_mag > np.finfo(float).eps:
+            mag /= max_mag
+        return gx, gy, mag, np.arctan2(gy, gx, dtype=np.float64)
+    # Sobel x/y yanıtları FilterBank'te saklanır; Sobel kenar haritası da aynı yanıtları kullanır
+    if bank is None:
+        bank = FilterBank(image, dtype=np.float64)
+    grads = bank.gradients()
+    return grads['grad_x'], grads['grad_y'], grads['magnitude'], grads['orientation']
+
+def _edge_magnitude_int(image, edge_int, gain):
+    # skimage sobel/prewitt ile aynı birim: sqrt((gx² + gy²) / 2), tamsayı gradyanlardan
+    gx = edge_int(image, axis=1)
+    gy = edge_int(image, axis=0)
+    mag = np.hypot(gx, gy, dtype=np.float64)
+    mag /= np.sqrt(2) * gain * np.iinfo(image.dtype).max
+    return mag
+
+def apply_edge_detectors(image, log_sigma=1.0, canny_sigma=1.0, bank=None, integer=False):
+    """integer=True: Sobel ve Prewitt uint8/uint16 girdiden tamsayı gradyanlarla; diğerleri float yoldan."""
+    if bank is None:
+        bank = FilterBank(image, dtype=np.float64)
+    edges = bank.edges(log_sigma=log_sigma, canny_sigma=canny_sigma)
+    if integer:
+        edges['Sobel'] = _edge_magnitude_int(image, filters.sobel_int, 4)
+        edges['Prewitt'] = _edge_magnitude_int(image, filters.prewitt_int, 3)
     return edges
 
-def plot_comparison(original, filtered_dict, main_title="Karşılaştırma", cmap='gray', save_path=None):
+def plot_comparison(original, filtered_dict, main_title="Karşılaştırma", cmap='gray', save_path=None,
+                    cmaps=None, colorbar=False, panel_width=4):
+    # matplotlib yalnızca çizim istendiğinde yüklenir; kaydedilecekse ekransız (Agg) çizilir
+    import matplotlib
+    if save_path:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    cmaps = cmaps or {}
     num_images = len(filtered_dict) + 1
     cols = 3
     rows = (num_images + cols - 1) // cols
 
-    fig, axes = plt.subplots(rows, cols, figsize=(cols * 4, rows * 4))
-    if num_images <= 1:
-        ax = np.array([axes])
-    elif rows == 1 and cols == 1:
-       axes = np.array([[axes]])
-    elif rows == 1 or cols == 1:
-        axes = axes.reshape(rows, cols)
-    
-    #axes null mı diye kontrol edelim
-    if axes is None:
-      print("Error: axes is None.")
-      return
-
+    fig, axes = plt.subplots(rows, cols, figsize=(cols * panel_width, rows * 4))
+    axes = np.asarray(axes).reshape(rows, cols)
     ax = axes.flat
 
     ax[0].imshow(original, cmap='gray' if original.ndim == 2 else None)
@@ -93,11 +149,11 @@ def plot_comparison(original, filtered_dict, main_title="Karşılaştırma", cma
     i = 1
     for title, img in filtered_dict.items():
         if i < len(ax):
-            img_cmap = cmap if img.ndim == 2 else None
+            img_cmap = cmaps.get(title, cmap) if img.ndim == 2 else None
             im = ax[i].imshow(img, cmap=img_cmap)
             ax[i].set_title(title)
             ax[i].axis('off')
-            if 'Orientation' in title:
+            if colorbar or 'Orientation' in title:
                  fig.colorbar(im, ax=ax[i], fraction=0.046, pad=0.04)
             i += 1
         else:
@@ -116,92 +172,123 @@ def plot_comparison(original, filtered_dict, main_title="Karşılaştırma", cma
     else:
         plt.show()
 
-image_names = ['camera', 'moon', 'coins']
-images_to_process = {name: getattr(data, name)() for name in image_names}
+def load_image(source):
+    # skimage.data örnek adı ya da dosya yolu; görüntü yalnızca işleneceği anda okunur
+    if not os.path.exists(source) and hasattr(data, source):
+        return getattr(data, source)()
+    if source.lower().endswith('.npy'):
+        return np.load(source, mmap_mode='r')
+    return io.imread(source)
 
-# a
-print("--- (a): Konvolüsyon Filtreleri")
-for name, img in images_to_process.items():
-    print(f"\nİşlenen Görüntü: {name}")
-    filtered_a = {}
-    for k in [3, 5]:
-        try:
-            filtered_a[f'Box (k={k})'] = apply_convolution(img, filter_type='box', k_size=k)
-            filtered_a[f'Gaussian (k={k})'] = apply_convolution(img, filter_type='gaussian', k_size=k)
-        except Exception as e:
-            print(f" Hata ({name}, k={k}): {e}")
-    try:
-        filtered_a[f'Laplacian (k=3)'] = apply_convolution(img, filter_type='laplacian', k_size=3)
-    except Exception as e:
-            print(f" Hata (Laplacian, {name}): {e}")
-
-    if filtered_a:
-        output_filename = os.path.join(OUTPUT_DIR, f"{name}_a_convolution.png")
-        plot_comparison(img, filtered_a, f"{name} - Konvolüsyon Filtreleri", save_path=output_filename)
-
-# (b): Gradyanlar
-print("\n--- (b): Gradyanlar ---")
-for name, img in images_to_process.items():
-    print(f"\nİşlenen Görüntü: {name}")
-    try:
-        gx, gy, mag, ori = calculate_gradients(img)
-        filtered_b = {
-            'Gradient X (Sobel_V)': gx,
-            'Gradient Y (Sobel_H)': gy,
-            'Magnitude': mag,
-            'Orientation': ori
-        }
-        cmaps = ['gray', 'gray', 'gray', 'hsv']
-
-        num_images = len(filtered_b) + 1
-        cols = 3
-        rows = (num_images + cols - 1) // cols
-        fig, axes = plt.subplots(rows, cols, figsize=(cols * 5, rows * 4))
-        if num_images <= 1: ax = np.array([axes])
-        elif rows == 1 and cols == 1: axes = np.array([[axes]])
-        elif rows == 1 or cols == 1: axes = axes.reshape(rows, cols)
-        
-        if axes is None:
-          print("Error: axes is None.")
-          continue 
-          
-        ax = axes.flat
-
-        ax[0].imshow(img, cmap='gray' if img.ndim == 2 else None)
-        ax[0].set_title("Orijinal")
-        ax[0].axis('off')
-
-        i = 1
-        for title, filtered_img in filtered_b.items():
-            if i < len(ax):
-                im = ax[i].imshow(filtered_img, cmap=cmaps[i-1])
-                ax[i].set_title(title)
-                ax[i].axis('off')
-                fig.colorbar(im, ax=ax[i], fraction=0.046, pad=0.04)
-                i += 1
-            else: break
-
-        for j in range(i, len(ax)): ax[j].axis('off')
-        fig.suptitle(f"{name} - Gradyanlar", fontsize=16)
-        plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-
-        output_filename_b = os.path.join(OUTPUT_DIR, f"{name}_b_gradients.png")
-        plt.savefig(output_filename_b, bbox_inches='tight')
-        print(f"Grafik kaydedildi: {output_filename_b}")
-        plt.close(fig) 
+def image_name(source):
+    return os.path.splitext(os.path.basename(source))[0]
+
+def safe_title(title):
+    return re.sub(r'[^0-9A-Za-z]+', '_', title).strip('_')
 
-    except Exception as e:
-        print(f"Gradyan hesaplama/kaydetme hatası ({name}): {e}")
-
-# (c): Kenar Belirleme Filtreleri
-print("\n--- (c) Kenar Belirleme Filtreleri ---")
-for name, img in images_to_process.items():
-    print(f"\nİşlenen Görüntü: {name}")
-    try:
-        edges_c = apply_edge_detectors(img, log_sigma=1.5, canny_sigma=1.5)
-        output_filename_c = os.path.join(OUTPUT_DIR, f"{name}_c_edge_detection.png")
-        plot_comparison(img, edges_c, f"{name} - Kenar Belirleme Filtreleri", cmap='gray', save_path=output_filename_c)
-    except Exception as e:
-        print(f"Kenar belirleme/kaydetme hatası ({name}): {e}")
-
-print(f"\nİşlem Tamamlandı. Çıktılar '{OUTPUT_DIR}' dizinine kaydedildi.")
\ No newline at end of file
+def run_convolution(img, bank):
+    filtered = {}
+    opts = {'bank': bank, 'dtype': bank.dtype}
+    for k in [3, 5]:
+        filtered[f'Box (k={k})'] = apply_convolution(img, filter_type='box', k_size=k, **opts)
+        filtered[f'Gaussian (k={k})'] = apply_convolution(img, filter_type='gaussian', k_size=k, **opts)
+    filtered['Laplacian (k=3)'] = apply_convolution(img, filter_type='laplacian', k_size=3, **opts)
+    return filtered
+
+def run_gradients(img, bank):
+    gx, gy, mag, ori = calculate_gradients(img, bank=bank)
+    return {
+        'Gradient X (Sobel_V)': gx,
+        'Gradient Y (Sobel_H)': gy,
+        'Magnitude': mag,
+        'Orientation': ori
+    }
+
+def run_edges(img, bank):
+    return apply_edge_detectors(img, log_sigma=1.5, canny_sigma=1.5, bank=bank)
+
+# aşama: (hesap, dosya soneki, başlık, grafik seçenekleri)
+STAGE_SPECS = {
+    'a': (run_convolution, "a_convolution", "Konvolüsyon Filtreleri", {}),
+    'b': (run_gradients, "b_gradients", "Gradyanlar",
+          {'cmaps': {'Orientation': 'hsv'}, 'colorbar': True, 'panel_width': 5}),
+    'c': (run_edges, "c_edge_detection", "Kenar Belirleme Filtreleri", {}),
+}
+
+def save_outputs(outputs, base, fmt='npy'):
+    # Sayısal çıktılar float32 .npy veya karolu .tif olarak; Canny maskeleri uint8
+    paths = []
+    for title, arr in outputs.items():
+        arr = arr.astype(np.uint8) if arr.dtype == bool else arr.astype(np.float32, copy=False)
+        path = f"{base}_{safe_title(title)}.{fmt}"
+        if fmt == 'tif':
+            import tifffile
+            tifffile.imwrite(path, arr, tile=TIF_TILE, compression='zlib')
+        else:
+            np.save(path, arr)
+        paths.append(path)
+    return paths
+
+def process_image(source, stages=STAGES, outdir=OUTPUT_DIR, plots=True, fmt=None, dtype=np.float64):
+    """
+    Tek bir görüntüyü seçilen aşamalardan geçirir. fmt verilirse sayısal çıktılar
+    yazılır; plots=False ise matplotlib hiç yüklenmez. Süreç havuzunda çalışabilir.
+    dtype hesap tipidir (varsayılan float64, tek görüntülük fonksiyonlarla aynı); float32'ye
+    dönüşüm yalnızca dosyaya yazarken yapılır.
+    """
+    name = image_name(source)
+    img = load_image(source)
+    bank = FilterBank(img, dtype=dtype)
+    written = []
+    for stage in stages:
+        compute, suffix, title, plot_opts = STAGE_SPECS[stage]
+        outputs = compute(img, bank)
+        base = os.path.join(outdir, f"{name}_{suffix}")
+        if fmt:
+            written += save_outputs(outputs, base, fmt)
+        if plots:
+            plot_comparison(img, outputs, f"{name} - {title}", save_path=f"{base}.png", **plot_opts)
+            written.append(f"{base}.png")
+    return name, written
+
+def main():
+    p = argparse.ArgumentParser(description="Ödev 6 filtre hattı")
+    p.add_argument("inputs", nargs="*", default=SAMPLE_IMAGES,
+                   help="Görüntü dosyaları veya skimage.data örnek adları")
+    p.add_argument("--stages", nargs="+", default=list(STAGES), choices=STAGES,
+                   help="a: konvolüsyon, b: gradyanlar, c: kenar belirleme")
+    p.add_argument("--outdir", default=OUTPUT_DIR)
+    p.add_argument("--jobs", type=int, default=1, help="Görüntüleri N süreçlik havuzda işle")
+    p.add_argument("--no-plots", action="store_true", help="Grafik çizme (yalnızca hesap)")
+    p.add_argument("--format", choices=FORMATS, default=None,
+                   help="Sayısal çıktıları float32 .npy veya karolu .tif olarak yaz")
+    p.add_argument("--dtype", choices=DTYPES, default='float64',
+                   help="Hesap tipi (float32 belleği yarıya indirir, sonuçlar yuvarlama kadar farklıdır)")
+    args = p.parse_args()
+
+    os.makedirs(args.outdir, exist_ok=True)
+    stages = [s for s in STAGES if s in args.stages]
+    job_args = (stages, args.outdir, not args.no_plots, args.format, DTYPES[args.dtype])
+
+    if args.jobs > 1:
+        with ProcessPoolExecutor(args.jobs) as pool:
+            futures = {pool.submit(process_image, src, *job_args): src for src in args.inputs}
+            for fut in as_completed(futures):
+                try:
+                    name, written = fut.result()
+                    print(f"{name}: {len(written)} dosya yazıldı")
+                except Exception as e:
+                    print(f"Hata ({futures[fut]}): {e}")
+    else:
+        for src in args.inputs:
+            print(f"\nİşlenen Görüntü: {src}")
+            try:
+                name, written = process_image(src, *job_args)
+                print(f"{name}: {len(written)} dosya yazıldı")
+            except Exception as e:
+                print(f"Hata ({src}): {e}")
+
+    print(f"\nİşlem Tamamlandı. Çıktılar '{args.outdir}' dizinine kaydedildi.")
+
+if __name__ == "__main__":
+    main()
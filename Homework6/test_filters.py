@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from scipy import ndimage as ndi
+from skimage import data, util
+
+import filters
+from filterbank import (FilterBank, PREWITT_X_WEIGHTS, PREWITT_Y_WEIGHTS,
+                        SOBEL_X_WEIGHTS, SOBEL_Y_WEIGHTS)
+from main import apply_convolution, apply_edge_detectors, calculate_gradients
+
+F32_TOL = 1e-3          # float32 yolu: float64'e göre en büyük fark, 8-bit gri seviye cinsinden
+
+
+@pytest.fixture(params=[np.uint8, np.uint16], ids=["uint8", "uint16"])
+def image(request):
+    img = data.camera()
+    return img if request.param == np.uint8 else util.img_as_uint(img) - np.uint16(37)
+
+def lsb(image):
+    return np.iinfo(image.dtype).max
+
+@pytest.mark.parametrize("k", [3, 5, 9])
+def test_box_int_within_half_lsb(image, k):
+    ref = apply_convolution(image, 'box', k) * lsb(image)
+    res = apply_convolution(image, 'box', k, integer=True)
+    assert res.dtype == image.dtype
+    assert np.abs(res - ref).max() <= 0.5 + 1e-9
+
+def test_laplacian_int_exact(image):
+    ref = apply_convolution(image, 'laplacian') * lsb(image)
+    res = apply_convolution(image, 'laplacian', integer=True)
+    np.testing.assert_array_equal(res, np.rint(ref))
+
+@pytest.mark.parametrize("edge_int, kx, ky, gain", [
+    (filters.sobel_int, SOBEL_X_WEIGHTS, SOBEL_Y_WEIGHTS, 4),
+    (filters.prewitt_int, PREWITT_X_WEIGHTS, PREWITT_Y_WEIGHTS, 3),
+], ids=["sobel", "prewitt"])
+def test_edge_int_exact(image, edge_int, kx, ky, gain):
+    img = util.img_as_float(image)
+    scale = gain * lsb(image)
+    np.testing.assert_array_equal(edge_int(image, axis=1), np.rint(ndi.convolve(img, kx, mode='reflect') * scale))
+    np.testing.assert_array_equal(edge_int(image, axis=0), np.rint(ndi.convolve(img, ky, mode='reflect') * scale))
+
+def test_gradients_int_match_float64(image):
+    gx, gy, mag, ori = calculate_gradients(image, integer=True)
+    fx, fy, fmag, fori = calculate_gradients(image)
+    np.testing.assert_array_equal(gx, np.rint(fx * 4 * lsb(image)))
+    np.testing.assert_array_equal(gy, np.rint(fy * 4 * lsb(image)))
+    np.testing.assert_allclose(mag, fmag, rtol=0, atol=1e-12)
+    # Düz bölgelerde yönelim tanımsız (float yolda ±0 artıkları); yalnızca gradyanlı pikseller
+    moving = mag > 0
+    np.testing.assert_allclose(np.angle(np.exp(1j * (ori - fori)))[moving], 0, atol=1e-9)
+
+def test_edge_detectors_int_match_float64(image):
+    res = apply_edge_detectors(image, integer=True)
+    ref = apply_edge_detectors(image)
+    for title in ('Sobel', 'Prewitt'):
+        np.testing.assert_allclose(res[title], ref[title], rtol=0, atol=1e-12)
+
+@pytest.mark.parametrize("filter_type", ['box', 'gaussian', 'laplacian'])
+def test_float32_close_to_float64(image, filter_type):
+    ref = apply_convolution(image, filter_type, 5)
+    res = apply_convolution(image, filter_type, 5, dtype=np.float32)
+    assert res.dtype == np.float32
+    assert np.abs(res - ref).max() * 255 <= F32_TOL
+
+def test_bank_dtype_mismatch_uses_requested_dtype(image):
+    bank = FilterBank(image, dtype=np.float32)
+    res = apply_convolution(image, 'gaussian', 5, bank=bank, dtype=np.float64)
+    assert res.dtype == np.float64
+    np.testing.assert_array_equal(res, apply_convolution(image, 'gaussian', 5))
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+from skimage import data
+from skimage.feature import canny
+
+import tiled
+from tiled import tiled_canny
+
+
+@pytest.fixture
+def image():
+    return data.camera()[:300, :260].astype(np.float32) / 255
+
+@pytest.mark.parametrize("private", [True, False], ids=["skimage-internal", "public-canny"])
+@pytest.mark.parametrize("sigma", [1.0, 2.5])
+def test_tiled_canny_matches_canny(monkeypatch, image, private, sigma):
+    if not private:
+        monkeypatch.setattr(tiled, "_preprocess", None)
+    elif tiled._preprocess is None:
+        pytest.skip("skimage.feature._canny bu sürümde yok")
+    ref = canny(image, sigma=sigma, low_threshold=0.05, high_threshold=0.15)
+    res = tiled_canny(image, sigma=sigma, low_threshold=0.05, high_threshold=0.15, tile=64, workers=2)
+    np.testing.assert_array_equal(res, ref)
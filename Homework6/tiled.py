@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Büyük (veya np.load(mmap_mode="r") ile eşlenmiş) rasterlarda Homework6 filtrelerini
+halo'lu karolar halinde, iş parçacığı havuzunda çalıştırır.
+
+Kullanım
+-------
+$ python tiled.py sahne.npy sobel.npy --filter sobel
+$ python tiled.py sahne.npy kenar.npy --filter canny --sigma 1.5 --tile 2048 --workers 8
+$ python tiled.py sahne.npy yumusak.npy --filter gaussian --sigma 3
+"""
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy import ndimage as ndi
+from skimage.feature import canny
+# skimage.feature.canny'nin kendi adımları; NMS büyüklüğünü bir kez hesaplayıp iki eşikle kullanmak için.
+# Özel API'dir (scikit-image 0.26 ile denendi); yoksa herkese açık canny ile iki geçişe düşülür
+try:
+    from skimage.feature._canny import _nonmaximum_suppression_bilinear, _preprocess
+except ImportError:
+    _nonmaximum_suppression_bilinear = _preprocess = None
+
+from filterbank import FilterBank, OUTPUTS
+from filters import GAUSS_TRUNCATE
+
+TILE = 1024                 # karo kenarı (piksel), halo hariç
+LOCAL_RADIUS = 1            # 3×3 ve 2×2 operatörlerin (Sobel, Prewitt, Roberts, Laplace) yarıçapı
+
+
+def gauss_radius(sigma, truncate=GAUSS_TRUNCATE):
+    # ndi.gaussian_filter'ın çekirdek yarıçapı
+    return int(truncate * float(sigma) + 0.5)
+
+def halo_radius(name, **params):
+    """Bir çıktının karo kenarında doğru olması için gereken komşuluk (piksel)."""
+    if name == "box":
+        return params.get("k_size", 3) // 2 + 1
+    if name == "gaussian":
+        return gauss_radius(params.get("sigma", 1.0))
+    if name == "log":
+        return gauss_radius(params.get("sigma", 1.0)) + LOCAL_RADIUS
+    if name == "canny":
+        # Gauss + Sobel + maksimum olmayanı bastırma + kenar maskesi aşındırması
+        return gauss_radius(params.get("sigma", 1.0)) + 3 * LOCAL_RADIUS
+    return LOCAL_RADIUS
+
+def iter_tiles(shape, tile=TILE, halo=0):
+    """
+    (çekirdek, halo'lu, iç) dilim üçlüleri üretir. Halo görüntü sınırında kırpılır; böylece
+    gerçek kenarlarda filtre kendi sınır kuralını uygular ve sonuç karosuz hesapla aynı olur.
+    """
+    h, w = shape[:2]
+    for r0 in range(0, h, tile):
+        r1 = min(r0 + tile, h)
+        hr0, hr1 = max(0, r0 - halo), min(h, r1 + halo)
+        for c0 in range(0, w, tile):
+            c1 = min(c0 + tile, w)
+            hc0, hc1 = max(0, c0 - halo), min(w, c1 + halo)
+            yield ((slice(r0, r1), slice(c0, c1)),
+                   (slice(hr0, hr1), slice(hc0, hc1)),
+                   (slice(r0 - hr0, r1 - hr0), slice(c0 - hc0, c1 - hc0)))
+
+def tiled_apply(raster, fn, halo, out, tile=TILE, workers=None):
+    """
+    fn(karo) sonucunun iç kısmını out'a yazar. Karolar ayrık bölgelere yazdığı için kilit
+    gerekmez; SciPy/skimage filtreleri GIL'i bıraktığından iş parçacıkları paralel çalışır.
+    """
+    def run(task):
+        core, outer, inner = task
+        out[core] = fn(np.asarray(raster[outer]))[inner]
+
+    tasks = list(iter_tiles(raster.shape, tile, halo))
+    with ThreadPoolExecutor(workers or os.cpu_count()) as pool:
+        for _ in pool.map(run, tasks):
+            pass
+    return out
+
+def tiled_filter(raster, name, out=None, tile=TILE, workers=None, dtype=np.float32, **params):
+    """
+    FilterBank çıktısını (ör. "sobel", "gaussian", "log") karo karo hesaplar.
+    Sonuç FilterBank(raster, dtype) ile karosuz hesaplanan çıktıyla aynıdır; yalnızca "box"
+    (kayan toplam) kayan nokta yuvarlaması kadar farklı olabilir. Canny için tiled_canny kullanılır.
+    """
+    if name == "canny":
+        return tiled_canny(raster, out=out, tile=tile, workers=workers, dtype=dtype, **params)
+    if name not in OUTPUTS:
+        raise ValueError(f"Bilinmeyen çıktı: {name}. Seçenekler: {', '.join(OUTPUTS)}")
+    if out is None:
+        out = np.empty(raster.shape[:2], dtype=dtype)
+
+    if name == "magnitude":
+        # Normalizasyon için gereken en büyük değer küreseldir: önce norm karo karo, sonra tek bölme
+        tiled_apply(raster, lambda t: np.hypot(*FilterBank(t, dtype).sobel_xy()),
+                    LOCAL_RADIUS, out, tile, workers)
+        max_mag = out.max()
+        if max_mag > np.finfo(float).eps:
+            for core, _, _ in iter_tiles(out.shape, tile):
+                out[core] /= max_mag
+        return out
+
+    def fn(t):
+        return getattr(FilterBank(t, dtype), name)(**params)
+    return tiled_apply(raster, fn, halo_radius(name, **params), out, tile, workers)
+
+def tiled_canny(raster, sigma=1.0, low_threshold=None, high_threshold=None, out=None,
+                tile=TILE, workers=None, dtype=np.float32):
+    """
+    Canny'nin yerel adımları (Gauss, Sobel, maksimum olmayanı bastırma, eşikleme) karo
+    karo; histerezis ise küreseldir: zayıf kenar maskesi tüm sahnede 8-komşulukla etiketlenir
+    ve güçlü piksel içeren bileşenler tutulur (skimage.feature.canny ile aynı kural).
+    """
+    low = 0.1 if low_threshold is None else low_threshold
+    high = 0.2 if high_threshold is None else high_threshold
+    if high < low:
+        raise ValueError("low_threshold, high_threshold'dan büyük olamaz")
+    shape = raster.shape[:2]
+    weak = np.empty(shape, dtype=bool)
+    strong = np.empty(shape, dtype=bool)
+
+    def local(t):
+        image = FilterBank(t, dtype).image
+        if _preprocess is None:
+            # low == high iken canny'nin histerezisi eşiği geçen tüm NMS piksellerini tutar; böylece
+            # iki çağrı tam olarak zayıf (>= low) ve güçlü (>= high) maskeleri verir
+            return np.stack([canny(image, sigma, low, low), canny(image, sigma, high, high)], axis=-1)
+        # canny() ile aynı adımlar (Gauss, Sobel, bilineer NMS); yumuşatma, gradyan ve NMS karo
+        # başına bir kez yapılır, zayıf/güçlü maskeler aynı bastırılmış büyüklükten eşiklenir
+        smoothed, eroded_mask = _preprocess(image, None, sigma, 'constant', 0.0)
+        jsobel = ndi.sobel(smoothed, axis=1)
+        isobel = ndi.sobel(smoothed, axis=0)
+        magnitude = isobel * isobel
+        magnitude += jsobel * jsobel
+        np.sqrt(magnitude, out=magnitude)
+        suppressed = _nonmaximum_suppression_bilinear(isobel, jsobel, magnitude, eroded_mask, low)
+        w = suppressed > 0
+        return np.stack([w, w & (suppressed >= high)], axis=-1)
+
+    halo = halo_radius("canny", sigma=sigma)
+
+    def run(task):
+        core, outer, inner = task
+        res = local(np.asarray(raster[outer]))[inner]
+        weak[core] = res[..., 0]
+        strong[core] = res[..., 1]
+
+    with ThreadPoolExecutor(workers or os.cpu_count()) as pool:
+        for _ in pool.map(run, list(iter_tiles(shape, tile, halo))):
+            pass
+
+    labels, count = ndi.label(weak, np.ones((3, 3), bool))
+    if out is None:
+        out = np.empty(shape, dtype=bool)
+    if count == 0:
+        out[...] = weak
+        return out
+    good_label = np.zeros(count + 1, dtype=bool)
+    good_label[np.unique(labels[strong])] = True
+    good_label[0] = False
+    np.take(good_label, labels, out=out)
+    return out
+
+def main():
+    p = argparse.ArgumentParser(description="Karo tabanlı, çok iş parçacıklı filtreleme")
+    p.add_argument("src", help="Girdi raster (.npy belleğe eşlenir)")
+    p.add_argument("dst", help="Çıktı .npy (karo karo yazılır)")
+    p.add_argument("--filter", default="sobel", choices=OUTPUTS)
+    p.add_argument("--sigma", type=float, default=None, help="gaussian / log / canny için sigma")
+    p.add_argument("--k-size", type=int, default=None, help="box için çekirdek boyutu")
+    p.add_argument("--tile", type=int, default=TILE)
+    p.add_argument("--workers", type=int, default=None, help="İş parçacığı sayısı (varsayılan: çekirdek sayısı)")
+    args = p.parse_args()
+
+    raster = np.load(args.src, mmap_mode="r")
+    params = {}
+    if args.sigma is not None:
+        params["sigma"] = args.sigma
+    if args.k_size is not None:
+        params["k_size"] = args.k_size
+    dtype = bool if args.filter == "canny" else np.float32
+    out = np.lib.format.open_memmap(args.dst, mode="w+", dtype=dtype, shape=raster.shape[:2])
+    tiled_filter(raster, args.filter, out=out, tile=args.tile, workers=args.workers, **params)
+    out.flush()
+    print(f"{args.src} → {args.dst} ({args.filter}, {raster.shape[0]}x{raster.shape[1]})")
+
+if __name__ == "__main__":
+    main()
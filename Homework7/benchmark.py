@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+distances.pairwise ile scipy.spatial.distance.cdist karşılaştırması (süre ve en büyük fark).
+
+Kullanım
+-------
+$ python benchmark.py                           # N=2000, d = 5, 32, 200
+$ python benchmark.py --n 10000 --d 5 64        # büyük N; sonuç bloklar halinde hesaplanır
+$ python benchmark.py --knn                     # NeighborIndex sorgu maliyeti, N = 10^4 .. 10^6
+"""
+import argparse
+import timeit
+
+import numpy as np
+from scipy.spatial.distance import cdist
+
+from data_gen import generate
+from distances import METRICS, pairwise
+from neighbors import NeighborIndex
+
+SCIPY_NAMES = {"euclidean": "euclidean", "cosine": "cosine", "manhattan": "cityblock",
+               "mahalanobis": "mahalanobis"}
+KNN_SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+
+
+def best(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+def knn_benchmark(sizes, n_queries, k, repeat, seed):
+    # Ağaç sorgusu N ile yavaşça (~log N) büyür; pairwise + argpartition ise doğrusal
+    queries = generate(n_queries, seed=seed + 1)
+    print(f"{n_queries} sorgu, k={k}, 5 öznitelik; süreler sorgu başına µs")
+    print(f"{'N':>9} {'metrik':>12} | {'kurulum ms':>10} {'ağaç':>8} {'pairwise':>9} {'hız':>7} | {'aynı':>5}")
+    for n in sizes:
+        data = generate(n, seed=seed)
+        for metric in METRICS:
+            t_build = best(lambda: NeighborIndex(data, metric), 1)
+            index = NeighborIndex(data, metric)
+            brute = NeighborIndex(data, metric, method="brute")
+            _, idx = index.query(queries, k)
+            _, ref = brute.query(queries, k)
+            t_tree = best(lambda: index.query(queries, k), repeat) / n_queries
+            t_brute = best(lambda: brute.query(queries, k), repeat) / n_queries
+            print(f"{n:>9} {metric:>12} | {t_build * 1e3:10.1f} {t_tree * 1e6:8.1f} {t_brute * 1e6:9.1f} "
+                  f"{t_brute / t_tree:6.0f}x | {np.array_equal(idx, ref)!s:>5}")
+
+def main():
+    p = argparse.ArgumentParser(description="Uzaklık matrisi motoru karşılaştırması")
+    p.add_argument("--n", type=int, default=2000, help="Örnek sayısı (N×N matris)")
+    p.add_argument("--d", type=int, nargs="+", default=[5, 32, 200], help="Öznitelik sayıları")
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--knn", action="store_true", help="kNN indeksini kaba kuvvetle karşılaştır")
+    p.add_argument("--sizes", type=int, nargs="+", default=KNN_SIZES, help="--knn için veri boyutları")
+    p.add_argument("--queries", type=int, default=1000, help="--knn için sorgu sayısı")
+    p.add_argument("--k", type=int, default=10)
+    args = p.parse_args()
+
+    if args.knn:
+        knn_benchmark(args.sizes, args.queries, args.k, args.repeat, args.seed)
+        return
+    rng = np.random.default_rng(args.seed)
+    print(f"N={args.n}, süreler ms; fark = cdist'e göre en büyük göreli fark")
+    print(f"{'d':>4} {'metrik':>12} | {'pairwise':>9} {'cdist':>9} {'hız':>6} | {'fark':>8}")
+    for d in args.d:
+        # Ödevdeki gibi farklı ölçeklerde öznitelikler
+        X = rng.uniform(0, 1, (args.n, d)) * np.logspace(0, 3, d) + np.linspace(-5, 1000, d)
+        cov = np.cov(X, rowvar=False)
+        for metric in METRICS:
+            kw = {"VI": np.linalg.inv(cov)} if metric == "mahalanobis" else {}
+            c = cov if metric == "mahalanobis" else None
+            ref = cdist(X, X, SCIPY_NAMES[metric], **kw)
+            diff = np.abs(pairwise(X, metric=metric, cov=c) - ref).max() / ref.max()
+            t_ours = best(lambda: pairwise(X, metric=metric, cov=c), args.repeat)
+            t_ref = best(lambda: cdist(X, X, SCIPY_NAMES[metric], **kw), args.repeat)
+            print(f"{d:>4} {metric:>12} | {t_ours * 1e3:9.1f} {t_ref * 1e3:9.1f} "
+                  f"{t_ref / t_ours:5.1f}x | {diff:8.1e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import numpy as np
+from scipy.linalg import cho_solve, cholesky, solve_triangular
+
+from feature_stats import FeatureStats
+
+FALLBACKS = ("pinv", "ridge")
+RIDGE_RTOL = 1e-6           # ridge: cov + RIDGE_RTOL·diag(cov)
+PINV_RTOL = 1e-10           # korelasyon matrisinde bu oranın altındaki özdeğerler (Cholesky'de köşegen²) sıfır sayılır
+
+
+class CovarianceModel:
+    """
+    Mahalanobis için bir kez ayrıştırılmış kovaryans. Önce Cholesky (cov = L Lᵀ) denenir;
+    matris tekil ya da pozitif tanımlı değilse fallback="ridge" küçük bir köşegen ekleyip
+    yeniden dener, fallback="pinv" ise özdeğer ayrışımıyla sözde ters kullanır (sıfır
+    varyanslı yönler uzaklığa katılmaz). Hangi yolun kullanıldığı kind özelliğindedir.
+
+    Veriden kurulan model (from_data / from_stats) satır eklendikçe add ile güncellenir:
+    Cholesky faktörüne her satır için rank-1 güncelleme uygulanır, yeniden ayrıştırılmaz.
+    """
+
+    def __init__(self, cov, fallback="pinv", stats=None):
+        if fallback not in FALLBACKS:
+            raise ValueError(f"fallback {FALLBACKS} içinden biri olmalı, gelen: {fallback}")
+        cov = np.atleast_2d(np.asarray(cov, dtype=float))
+        if cov.ndim != 2 or cov.shape[0] != cov.shape[1]:
+            raise ValueError(f"Kovaryans kare matris olmalı, gelen boyut: {cov.shape}")
+        self.cov = cov
+        self.fallback = fallback
+        self.stats = stats
+        self._factorize()
+
+    @classmethod
+    def from_stats(cls, stats, fallback="pinv"):
+        # FeatureStats ile paylaşılır: add, özeti de günceller
+        return cls(stats.cov(), fallback, stats)
+
+    @classmethod
+    def from_data(cls, data, fallback="pinv"):
+        return cls.from_stats(FeatureStats.from_array(np.atleast_2d(data)), fallback)
+
+    @property
+    def n_features(self):
+        return self.cov.shape[0]
+
+    def _factorize(self):
+        # Eşikler ölçekten bağımsız olsun diye korelasyon matrisinde (D^-1/2 C D^-1/2) çalışılır;
+        # faktör sonunda sütun ölçekleriyle geri çarpılır (cov = (D^1/2 Lc)(D^1/2 Lc)ᵀ)
+        self._precision = None
+        var = np.diag(self.cov).copy()
+        scale = np.sqrt(np.where(var > 0, var, 1.0))
+        corr = self.cov / np.outer(scale, scale)
+        try:
+            factor = cholesky(corr, lower=True)
+            # Yuvarlama tekil bir matrisi "pozitif tanımlı" gösterebilir; köşegen oranı bunu yakalar
+            diag = np.abs(np.diag(factor))
+            if diag.min() ** 2 > PINV_RTOL * diag.max() ** 2:
+                self.factor, self.kind = factor * scale[:, None], "cholesky"
+                return
+        except np.linalg.LinAlgError:
+            pass
+        if self.fallback == "ridge":
+            # Korelasyon uzayında RIDGE_RTOL·I, yani cov + RIDGE_RTOL·diag(cov)
+            factor = cholesky(corr + RIDGE_RTOL * np.eye(self.n_features), lower=True)
+            self.factor, self.kind = factor * scale[:, None], "ridge"
+            return
+        # Sözde ters: corr⁺ = V diag(1/λ) Vᵀ = Wᵀ W, W = diag(λ^-1/2) Vᵀ (yalnızca λ > eşik);
+        # x önce ölçeklerine bölündüğünden cov için faktör W D^-1/2
+        vals, vecs = np.linalg.eigh(corr)
+        keep = vals > PINV_RTOL * max(vals.max(), 0)
+        self.factor = vecs[:, keep].T / np.sqrt(vals[keep])[:, None] / scale[None, :]
+        self.kind = "pinv"
+
+    @property
+    def rank(self):
+        return self.factor.shape[0] if self.kind == "pinv" else self.n_features
+
+    @property
+    def precision(self):
+        # cov⁻¹ (pinv'de cov⁺); yalnızca gerektiğinde ve bir kez hesaplanır
+        if self._precision is None:
+            if self.kind == "pinv":
+                self._precision = self.factor.T @ self.factor
+            else:
+                self._precision = cho_solve((self.factor, True), np.eye(self.n_features))
+        return self._precision
+
+    def whiten(self, X):
+        """z = L⁻¹ x (pinv'de z = W x): Mahalanobis uzaklığı z uzayında Öklid uzaklığıdır."""
+        X = np.asarray(X, dtype=float)
+        if X.shape[-1] != self.n_features:
+            raise ValueError(f"Öznitelik sayıları uyuşmuyor: {self.n_features} ve {X.shape[-1]}")
+        if self.kind == "pinv":
+            return X @ self.factor.T
+        return solve_triangular(self.factor, X.T, lower=True).T
+
+    def mahalanobis(self, X, Y=None, out=None):
+        """N×M Mahalanobis uzaklık matrisi (Y verilmezse N×N); faktör tüm bloklarda paylaşılır."""
+        from distances import pairwise     # distances bu modülü içe aktarır; döngüyü önlemek için burada
+        return pairwise(X, Y, metric="mahalanobis", cov=self, out=out)
+
+    def add(self, rows):
+        """
+        Yeni satırları modele ekler. n örnekli, ddof=1 kovaryans için x eklenince
+        cov' = (n-1)/n · cov + δδᵀ/(n+1), δ = x - μ; yani L ölçeklenir ve rank-1 güncellenir.
+        Faktör Cholesky değilse ya da satır sayısı öznitelik sayısını aşıyorsa yeniden ayrıştırmak
+        daha ucuz olduğundan öyle yapılır.
+        """
+        if self.stats is None:
+            raise ValueError("Satır eklemek için model from_data veya from_stats ile kurulmalı")
+        rows = np.atleast_2d(np.asarray(rows, dtype=float))
+        if self.kind != "cholesky" or rows.shape[0] > self.n_features:
+            self.stats.update(rows)
+            self.cov = self.stats.cov()
+            self._factorize()
+            return self
+
+        L = self.factor
+        for x in rows:
+            n = self.stats.n
+            delta = x - self.stats.mean
+            L *= np.sqrt((n - 1) / n)
+            cholupdate(L, delta / np.sqrt(n + 1))
+            self.stats.update(x)
+        self.cov = self.stats.cov()
+        self._precision = None
+        return self
+
+
+def cholupdate(L, v):
+    """
+    Yerinde rank-1 güncelleme: L Lᵀ + v vᵀ = L' L'ᵀ (alt üçgen L). O(d²); her adımda bir
+    Givens benzeri dönüşüm, kalan sütun vektörel güncellenir.
+    """
+    v = np.array(v, dtype=float)
+    for k in range(L.shape[0]):
+        r = np.hypot(L[k, k], v[k])
+        c, s = r / L[k, k], v[k] / L[k, k]
+        L[k, k] = r
+        L[k + 1:, k] = (L[k + 1:, k] + s * v[k + 1:]) / c
+        v[k + 1:] = c * v[k + 1:] - s * L[k + 1:, k]
+    return L
+
+def as_model(cov, fallback="pinv"):
+    # Matris ya da hazır model kabul eden fonksiyonlar için
+    return cov if isinstance(cov, CovarianceModel) else CovarianceModel(cov, fallback)
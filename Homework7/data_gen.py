@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tohumlu, vektörel veri matrisi üreteci. Her öznitelik kendi [alt, üst) aralığında düzgün
+dağılır; matris BLOCK_ROWS satırlık bloklar halinde, her blok SeedSequence.spawn ile
+türetilmiş bağımsız bir akıştan üretilir. Böylece aynı tohum, bellekte ya da .npy
+dosyasında, tek ya da çok iş parçacığıyla her zaman aynı matrisi verir.
+
+Kullanım
+-------
+$ python data_gen.py veri.npy --rows 100000000 --seed 42            # ~4 GB, RAM'e sığması gerekmez
+$ python data_gen.py veri.npy --rows 1000000 --features 12 --workers 4
+"""
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+FEATURE_RANGES = [(0, 1), (1, 10), (50, 150), (-5, 5), (1000, 2000)]   # ödevdeki öznitelik aralıkları
+BLOCK_ROWS = 2 ** 18        # bir akışın ürettiği satır sayısı (5 öznitelikte ~10 MB)
+
+
+def range_bounds(ranges=FEATURE_RANGES, n_features=None):
+    # (alt, üst) vektörleri; n_features aralık sayısından fazlaysa aralıklar sırayla tekrarlanır
+    ranges = np.asarray(ranges, dtype=float)
+    if ranges.ndim != 2 or ranges.shape[1] != 2:
+        raise ValueError("Aralıklar (alt, üst) çiftlerinden oluşmalı")
+    if n_features is not None:
+        ranges = ranges[np.arange(n_features) % len(ranges)]
+    return ranges[:, 0], ranges[:, 1]
+
+def fill(out, low, high, seed_seq, block_rows=BLOCK_ROWS, workers=1):
+    """
+    out'u (dizi veya memmap) blok blok doldurur. i. blok seed_seq.spawn'ın i. çocuğundan
+    üretilir; sonuç workers'tan bağımsızdır. Generator toplu üretimde GIL'i bırakır.
+    """
+    n = out.shape[0]
+    starts = range(0, n, block_rows)
+    children = seed_seq.spawn(len(starts))
+    width = high - low
+
+    def run(task):
+        r, child = task
+        block = out[r:min(r + block_rows, n)]
+        np.random.default_rng(child).random(out=block)
+        block *= width
+        block += low
+
+    tasks = list(zip(starts, children))
+    if workers == 1:
+        for task in tasks:
+            run(task)
+    else:
+        with ThreadPoolExecutor(workers) as pool:
+            for _ in pool.map(run, tasks):
+                pass
+    return out
+
+def generate(n_samples, ranges=FEATURE_RANGES, seed=None, n_features=None, path=None,
+             workers=1, block_rows=BLOCK_ROWS):
+    """
+    n_samples × n_features boyutlu float64 veri matrisi. path verilirse sonuç doğrudan
+    belleğe eşlenmiş .npy dosyasına yazılır ve np.memmap döner.
+    """
+    low, high = range_bounds(ranges, n_features)
+    shape = (n_samples, low.size)
+    if path is None:
+        out = np.empty(shape)
+    else:
+        out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=shape)
+    fill(out, low, high, np.random.SeedSequence(seed), block_rows, workers)
+    if path is not None:
+        out.flush()
+    return out
+
+def main():
+    p = argparse.ArgumentParser(description="Tohumlu veri matrisi üreteci")
+    p.add_argument("dst", help="Çıktı .npy dosyası")
+    p.add_argument("--rows", type=int, required=True, help="Örnek (satır) sayısı")
+    p.add_argument("--features", type=int, default=None, help="Öznitelik sayısı (varsayılan: aralık sayısı)")
+    p.add_argument("--seed", type=int, default=None)
+    p.add_argument("--workers", type=int, default=None, help="İş parçacığı sayısı (varsayılan: çekirdek sayısı)")
+    args = p.parse_args()
+
+    data = generate(args.rows, seed=args.seed, n_features=args.features, path=args.dst,
+                    workers=args.workers or os.cpu_count())
+    print(f"{args.dst}: {data.shape[0]}x{data.shape[1]} float64, tohum={args.seed}")
+
+if __name__ == "__main__":
+    main()
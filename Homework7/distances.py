@@ -0,0 +1,105 @@
+import numpy as np
+from scipy.spatial import distance
+
+from covariance import as_model
+
+METRICS = ("euclidean", "cosine", "manhattan", "mahalanobis")
+BLOCK_BYTES = 64 * 2 ** 20      # bir blokta oluşturulan ara dizilerin üst sınırı
+GRAM_RTOL = 1e-6                # d² < GRAM_RTOL·(en büyük ||x||² + ||y||²) ise Gram sonucu güvenilmez
+
+
+def unit_rows(X):
+    # Kosinüs için satırları birim uzunluğa getirir; sıfır vektörler sıfır kalır (benzerlik 0)
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    return np.divide(X, norms, out=np.zeros_like(X, dtype=float), where=norms > 0)
+
+def block_rows(n_cols, itemsize=8):
+    # Bir bloğun satır × sütun ara dizisi BLOCK_BYTES'ı aşmasın
+    return max(1, BLOCK_BYTES // (n_cols * itemsize))
+
+def _prepare(X, Y, metric, cov):
+    """Y bir kez hazırlanır (merkezleme, beyazlatma, normalizasyon); X bloklar halinde aynı dönüşümü alır."""
+    if metric == "mahalanobis":
+        if cov is None:
+            cov = np.cov(X if Y is None else np.vstack([X, Y]), rowvar=False)
+        # Ayrışım modelde bir kez yapılır; tekil kovaryansta pinv/ridge yedeğine düşer
+        transform = as_model(cov).whiten
+    elif metric == "euclidean":
+        # Gram hilesinde ||x||² + ||y||² - 2x·y sadeleşmesi büyük ortalamalarda hassasiyet kaybeder;
+        # uzaklık ötelemeden bağımsız olduğu için önce Y'nin ortalaması çıkarılır
+        center = np.asarray(Y if Y is not None else X, dtype=float).mean(axis=0)
+        transform = lambda A: np.asarray(A, dtype=float) - center
+    elif metric == "cosine":
+        transform = lambda A: unit_rows(np.asarray(A, dtype=float))
+    else:
+        transform = lambda A: np.asarray(A, dtype=float)
+    return transform
+
+def pairwise(X, Y=None, metric="euclidean", cov=None, out=None):
+    """
+    N×M uzaklık matrisi (Y verilmezse N×N). Satır blokları halinde hesaplanır, böylece
+    ara bellek BLOCK_BYTES ile sınırlıdır; out büyük sonuçlar için np.memmap olabilir.
+      euclidean   : Gram matrisi (X Yᵀ) ile, sqrt(max(0, ||x||² + ||y||² - 2x·y))
+      cosine      : 1 - x̂·ŷ, satırlar önceden birim uzunlukta (sıfır vektör → uzaklık 1)
+      manhattan   : Σ|x - y| (Gram karşılığı yok; blok başına cdist)
+      mahalanobis : Cholesky ile beyazlatılmış uzayda Öklid; cov bir matris ya da
+                    covariance.CovarianceModel olabilir, verilmezse verinin kovaryansı
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric {METRICS} içinden biri olmalı, gelen: {metric}")
+    X = np.atleast_2d(X)
+    same = Y is None
+    Y = X if same else np.atleast_2d(Y)
+    if X.shape[1] != Y.shape[1]:
+        raise ValueError(f"Öznitelik sayıları uyuşmuyor: {X.shape[1]} ve {Y.shape[1]}")
+
+    transform = _prepare(X, None if same else Y, metric, cov)
+    Yt = transform(Y)
+    if metric in ("euclidean", "mahalanobis"):
+        y_sq = np.einsum("ij,ij->i", Yt, Yt)
+        y_max = y_sq.max()
+
+    n, m = X.shape[0], Y.shape[0]
+    if out is None:
+        out = np.empty((n, m))
+    rows = block_rows(m)
+    for r in range(0, n, rows):
+        sl = slice(r, min(r + rows, n))
+        Xb = Yt[sl] if same else transform(X[sl])
+        if metric == "manhattan":
+            out[sl] = distance.cdist(Xb, Yt, "cityblock")
+        elif metric == "cosine":
+            block = np.matmul(Xb, Yt.T)
+            np.subtract(1.0, block, out=block)
+            out[sl] = block
+        else:
+            x_sq = np.einsum("ij,ij->i", Xb, Xb)
+            block = np.matmul(Xb, Yt.T)
+            block *= -2
+            block += x_sq[:, None]
+            block += y_sq[None, :]
+            # Çok yakın çiftlerde sadeleşme hatası uzaklığın kendisinden büyük olabilir;
+            # bu (az sayıdaki) elemanlar doğrudan fark vektöründen yeniden hesaplanır
+            rows_i, cols_j = np.nonzero(block < GRAM_RTOL * (x_sq.max() + y_max))
+            if rows_i.size:
+                diff = Xb[rows_i] - Yt[cols_j]
+                block[rows_i, cols_j] = np.einsum("ij,ij->i", diff, diff)
+            np.maximum(block, 0, out=block)
+            np.sqrt(block, out=block)
+            out[sl] = block
+    return out
+
+def paired(X, Y, metric="euclidean", cov=None):
+    """Satır satır eşleşmiş uzaklıklar: d(X[i], Y[i]). Çift listesi için N×N matris kurulmaz."""
+    if metric not in METRICS:
+        raise ValueError(f"metric {METRICS} içinden biri olmalı, gelen: {metric}")
+    X, Y = np.atleast_2d(X).astype(float), np.atleast_2d(Y).astype(float)
+    if metric == "euclidean":
+        return np.linalg.norm(X - Y, axis=1)
+    if metric == "manhattan":
+        return np.abs(X - Y).sum(axis=1)
+    if metric == "cosine":
+        return 1 - np.einsum("ij,ij->i", unit_rows(X), unit_rows(Y))
+    if cov is None:
+        raise ValueError("Mahalanobis için kovaryans matrisi gerekli")
+    return np.linalg.norm(as_model(cov).whiten(X - Y), axis=1)
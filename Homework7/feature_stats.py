@@ -0,0 +1,105 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+CHUNK_ROWS = 2 ** 16        # bir parçada okunan satır sayısı (memmap'te sayfa sayfa okunur)
+
+
+class FeatureStats:
+    """
+    Öznitelik başına ortalama, varyans, standart sapma ve tam kovaryans için tek geçişli
+    birikimci. Her parça kendi ortalaması ve merkezlenmiş çarpım matrisiyle (M2 = Σ(x-μ)(x-μ)ᵀ)
+    özetlenir ve Chan'ın birleştirme formülüyle eklenir; büyük ortalamalı verilerde
+    Σx² - nμ² sadeleşmesindeki hassasiyet kaybı olmaz. İki birikimci merge ile birleşir,
+    böylece paralel işçilerin sonuçları tek bir özet verir.
+    """
+
+    def __init__(self, n_features=None):
+        self.n = 0
+        self._mean = None if n_features is None else np.zeros(n_features)
+        self._m2 = None if n_features is None else np.zeros((n_features, n_features))
+
+    def _merge(self, n, mean, m2):
+        if n == 0:
+            return self
+        if self.n == 0:
+            self.n, self._mean, self._m2 = n, mean.copy(), m2.copy()
+            return self
+        if mean.shape != self._mean.shape:
+            raise ValueError(f"Öznitelik sayıları uyuşmuyor: {self._mean.shape[0]} ve {mean.shape[0]}")
+        total = self.n + n
+        delta = mean - self._mean
+        self._mean += delta * (n / total)
+        self._m2 += m2
+        self._m2 += np.outer(delta, delta) * (self.n * n / total)
+        self.n = total
+        return self
+
+    def update(self, chunk):
+        """Bir satır parçası (örnek × öznitelik) ekler."""
+        chunk = np.asarray(chunk, dtype=float)
+        if chunk.ndim == 1:
+            chunk = chunk[None, :]
+        if chunk.shape[0] == 0:
+            return self
+        mean = chunk.mean(axis=0)
+        centered = chunk - mean
+        return self._merge(chunk.shape[0], mean, centered.T @ centered)
+
+    def merge(self, other):
+        return self._merge(other.n, other._mean, other._m2) if other.n else self
+
+    def _check(self, ddof=0):
+        if self.n - ddof <= 0:
+            raise ValueError(f"En az {ddof + 1} örnek gerekli, eklenen: {self.n}")
+
+    @property
+    def mean(self):
+        self._check()
+        return self._mean.copy()
+
+    def var(self, ddof=0):
+        # np.var gibi varsayılan ddof=0 (popülasyon varyansı)
+        self._check(ddof)
+        return np.diag(self._m2) / (self.n - ddof)
+
+    def std(self, ddof=0):
+        return np.sqrt(self.var(ddof))
+
+    def cov(self, ddof=1):
+        # np.cov(rowvar=False) gibi varsayılan ddof=1
+        self._check(ddof)
+        return self._m2 / (self.n - ddof)
+
+    @classmethod
+    def from_array(cls, data, chunk_rows=CHUNK_ROWS, start=0, stop=None):
+        """data[start:stop] satırlarını parça parça tarar (np.load(..., mmap_mode="r") ile de çalışır)."""
+        stop = data.shape[0] if stop is None else stop
+        stats = cls(data.shape[1])
+        for r in range(start, stop, chunk_rows):
+            stats.update(data[r:min(r + chunk_rows, stop)])
+        return stats
+
+
+def scan(data, chunk_rows=CHUNK_ROWS, workers=None):
+    """
+    Veri matrisini (dizi, memmap veya .npy yolu) satır aralıklarına bölüp iş parçacıklarında
+    tarar ve özetleri birleştirir. NumPy matris çarpımı GIL'i bıraktığı için işçiler paralel çalışır.
+    """
+    if isinstance(data, (str, os.PathLike)):
+        data = np.load(data, mmap_mode="r")
+    workers = workers or os.cpu_count()
+    n = data.shape[0]
+    # Her işçiye bir kesintisiz satır aralığı (parça sınırlarına hizalı)
+    per_worker = -(-n // (workers * chunk_rows)) * chunk_rows or chunk_rows
+    ranges = [(r, min(r + per_worker, n)) for r in range(0, n, per_worker)]
+    if len(ranges) <= 1:
+        return FeatureStats.from_array(data, chunk_rows)
+
+    with ThreadPoolExecutor(workers) as pool:
+        parts = pool.map(lambda rs: FeatureStats.from_array(data, chunk_rows, *rs), ranges)
+        total = FeatureStats(data.shape[1])
+        for part in parts:
+            total.merge(part)
+    return total
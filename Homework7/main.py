@@ -3,6 +3,12 @@ import random
 import logging
 from scipy.spatial import distance # ÖZELLİK HESAPLARI doğrulaması için
 
+from covariance import CovarianceModel
+from data_gen import generate
+from distances import pairwise
+from feature_stats import FeatureStats
+from neighbors import NeighborIndex
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logging.info("7.Odev - Veri Matrisinin Oluşturulması ve Uzaklık Hesaplamaları")
 
@@ -16,12 +22,10 @@ ozellik_araliklari = [
     (1000, 2000)  
 ]
 
-veri_matrisi = np.zeros((ornek_sayisi, ozellik_sayisi))
+tohum = None       # sabit bir tamsayı verilirse aynı veri matrisi yeniden üretilir
 
-for j in range(ozellik_sayisi):  
-    min_val, max_val = ozellik_araliklari[j]
-    for i in range(ornek_sayisi): 
-        veri_matrisi[i, j] = random.uniform(min_val, max_val)
+# Tek vektörel çağrı, np.random.Generator ile (data_gen); büyük boyutlar için path= ile .npy'ye yazılabilir
+veri_matrisi = generate(ornek_sayisi, ozellik_araliklari, seed=tohum, n_features=ozellik_sayisi)
 
 print("OLUŞTURULAN VERİ MATRİSİ")
 np.set_printoptions(precision=3, suppress=True)
@@ -30,13 +34,19 @@ print("-" * 40)
 
 # 1) Her bir özniteliğin ortalama, standart sapma ve varyans değerleri hesaplanması
 print("\n 1) ÖZNİTELİK İSTATİSTİKLERİ HESAPLANIYOR")
+# Ortalama, varyans ve kovaryans tek geçişte (feature_stats); büyük veride satır parçalarıyla
+istatistikler = FeatureStats.from_array(veri_matrisi)
+ortalamalar = istatistikler.mean
+varyanslar = istatistikler.var()
+std_sapmalar = istatistikler.std()
+
 for j in range(ozellik_sayisi):
     ozellik_verisi = veri_matrisi[:, j] 
 
-    ortalama_hesaplanan = np.sum(ozellik_verisi) / ornek_sayisi
+    ortalama_hesaplanan = ortalamalar[j]
     ortalama_numpy = np.mean(ozellik_verisi)
-    varyans_hesaplanan = np.sum((ozellik_verisi - ortalama_hesaplanan)**2) / ornek_sayisi
-    std_sapma_hesaplanan = np.sqrt(varyans_hesaplanan)
+    varyans_hesaplanan = varyanslar[j]
+    std_sapma_hesaplanan = std_sapmalar[j]
     std_sapma_numpy = np.std(ozellik_verisi)
     varyans_numpy = np.var(ozellik_verisi) 
 
@@ -48,8 +58,9 @@ for j in range(ozellik_sayisi):
 print("-" * 40)
 
 print("\n--- 2) KOVARYANS MATRİSİ ---")
-kovaryans_matrisi = np.cov(veri_matrisi, rowvar=False)
+kovaryans_matrisi = istatistikler.cov()        # np.cov(veri_matrisi, rowvar=False) ile aynı
 print(kovaryans_matrisi)
+print(f"np.cov ile en büyük fark: {np.abs(kovaryans_matrisi - np.cov(veri_matrisi, rowvar=False)).max():.2e}")
 print("-" * 40)
 
 print("\n 3) UZAKLIK HESAPLAMALARI")
@@ -75,6 +86,16 @@ secilen_ciftler_indeks = [
     (5, 9)
 ]
 
+# Tüm çiftlerin uzaklıkları tek seferde, vektörel olarak (distances.pairwise)
+uzaklik_matrisleri = {metrik: pairwise(veri_matrisi, metric=metrik)
+                      for metrik in ("euclidean", "cosine", "manhattan")}
+# Kovaryans bir kez ayrıştırılır (Cholesky, tekilse sözde ters); her çift için ters matris alınmaz
+kovaryans_modeli = CovarianceModel.from_stats(istatistikler)
+if kovaryans_modeli.kind != "cholesky":
+    print(f"Kovaryans matrisi tekil (singular), sözde ters kullanılıyor (rank {kovaryans_modeli.rank}).")
+uzaklik_matrisleri["mahalanobis"] = kovaryans_modeli.mahalanobis(veri_matrisi)
+ters_kovaryans_matrisi = kovaryans_modeli.precision     # SciPy doğrulaması için, faktörden
+
 for i, cift in enumerate(secilen_ciftler_indeks):
     ornek1_idx, ornek2_idx = cift
     vektor1 = veri_matrisi[ornek1_idx, :]
@@ -83,10 +104,7 @@ for i, cift in enumerate(secilen_ciftler_indeks):
     print(f"\n--- Örnek Çifti {i+1} (Örnek {ornek1_idx+1} ve Örnek {ornek2_idx+1}) ---")
 
     # a) Euclidean Uzaklığı
-    fark_kare_toplam = 0
-    for k in range(ozellik_sayisi):
-        fark_kare_toplam += (vektor1[k] - vektor2[k])**2
-    euclidean_hesaplanan = np.sqrt(fark_kare_toplam)
+    euclidean_hesaplanan = uzaklik_matrisleri["euclidean"][ornek1_idx, ornek2_idx]
     euclidean_numpy = np.linalg.norm(vektor1 - vektor2)
     euclidean_scipy = distance.euclidean(vektor1, vektor2)
     print(f"  Euclidean Uzaklığı (Hesaplanan): {euclidean_hesaplanan:.3f}")
@@ -94,24 +112,14 @@ for i, cift in enumerate(secilen_ciftler_indeks):
     print(f"  Euclidean Uzaklığı (SciPy): {euclidean_scipy:.3f}")
 
     # b) Cosine Uzaklığı (1 - Cosine Benzerliği)
-    dot_product = np.dot(vektor1, vektor2)
-    norm_vektor1 = np.linalg.norm(vektor1)
-    norm_vektor2 = np.linalg.norm(vektor2)
-    if norm_vektor1 == 0 or norm_vektor2 == 0: 
-        cosine_benzerligi_hesaplanan = 0 if dot_product == 0 else 1 
-    else:
-        cosine_benzerligi_hesaplanan = dot_product / (norm_vektor1 * norm_vektor2)
-    cosine_uzakligi_hesaplanan = 1 - cosine_benzerligi_hesaplanan
+    cosine_uzakligi_hesaplanan = uzaklik_matrisleri["cosine"][ornek1_idx, ornek2_idx]
     # SciPy ile (doğrulama):
     cosine_scipy = distance.cosine(vektor1, vektor2) # Bu direkt uzaklığı verir
     print(f"  Cosine Uzaklığı (1 - Benzerlik_Hesaplanan): {cosine_uzakligi_hesaplanan:.3f}")
     print(f"  Cosine Uzaklığı (SciPy): {cosine_scipy:.3f}")
 
     # c) Manhattan (City Block) Uzaklığı
-    mutlak_fark_toplam = 0
-    for k in range(ozellik_sayisi):
-        mutlak_fark_toplam += abs(vektor1[k] - vektor2[k])
-    manhattan_hesaplanan = mutlak_fark_toplam
+    manhattan_hesaplanan = uzaklik_matrisleri["manhattan"][ornek1_idx, ornek2_idx]
     manhattan_numpy = np.sum(np.abs(vektor1 - vektor2))
     manhattan_scipy = distance.cityblock(vektor1, vektor2)
     print(f"  Manhattan Uzaklığı (Hesaplanan): {manhattan_hesaplanan:.3f}")
@@ -119,16 +127,22 @@ for i, cift in enumerate(secilen_ciftler_indeks):
     print(f"  Manhattan Uzaklığı (SciPy cityblock): {manhattan_scipy:.3f}")
 
     # d) Mahalanobis Uzaklığı
-    try:
-        ters_kovaryans_matrisi = np.linalg.inv(kovaryans_matrisi)
-        fark_vektoru = vektor1 - vektor2
-        mahalanobis_hesaplanan = np.sqrt(np.dot(np.dot(fark_vektoru.T, ters_kovaryans_matrisi), fark_vektoru))
-        mahalanobis_scipy = distance.mahalanobis(vektor1, vektor2, ters_kovaryans_matrisi)
-        print(f"  Mahalanobis Uzaklığı (Hesaplanan): {mahalanobis_hesaplanan:.3f}")
-        print(f"  Mahalanobis Uzaklığı (SciPy): {mahalanobis_scipy:.3f}")
-
-    except np.linalg.LinAlgError:
-        print("  Mahalanobis Uzaklığı: Kovaryans matrisi tekil (singular), tersi alınamıyor.")
+    mahalanobis_hesaplanan = uzaklik_matrisleri["mahalanobis"][ornek1_idx, ornek2_idx]
+    mahalanobis_scipy = distance.mahalanobis(vektor1, vektor2, ters_kovaryans_matrisi)
+    print(f"  Mahalanobis Uzaklığı (Hesaplanan): {mahalanobis_hesaplanan:.3f}")
+    print(f"  Mahalanobis Uzaklığı (SciPy): {mahalanobis_scipy:.3f}")
+
+print("-" * 40)
+
+print("\n 4) EN YAKIN KOMŞULAR")
+# Her metrik için bir indeks; sorgular toplu halde (neighbors.NeighborIndex)
+komsu_sayisi = min(3, ornek_sayisi - 1)
+for metrik in ("euclidean", "cosine", "manhattan", "mahalanobis"):
+    indeks = NeighborIndex(veri_matrisi, metric=metrik, cov=kovaryans_modeli)
+    # Örneğin kendisi de sonuçta olacağı için bir fazla komşu istenir ve ilki atlanır
+    uzakliklar, komsular = indeks.query(veri_matrisi[:1], k=komsu_sayisi + 1)
+    metin = ", ".join(f"Örnek {j+1} ({d:.3f})" for d, j in zip(uzakliklar[0, 1:], komsular[0, 1:]))
+    print(f"  Örnek 1'e en yakın {komsu_sayisi} örnek ({metrik}): {metin}")
 
 print("-" * 40)
 print("\nÖDEV TAMAMLANDI.")
\ No newline at end of file
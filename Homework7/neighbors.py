@@ -0,0 +1,106 @@
+import os
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from covariance import as_model
+from distances import METRICS, block_rows, pairwise, unit_rows
+
+TREE_MAX_DIM = 16       # bu boyuta kadar KD-ağacı; üstünde ağaç budayamaz, bloklu kaba kuvvet kullanılır
+LEAF_SIZE = 16
+
+
+class NeighborIndex:
+    """
+    Veri matrisi üzerinde toplu kNN ve yarıçap sorguları. Her metrik bir Minkowski
+    uzaklığına indirgenir ve veri yalnızca bir kez dönüştürülür:
+      mahalanobis : CovarianceModel ile beyazlatma, ardından Öklid
+      cosine      : satırlar birim uzunlukta; 1 - x̂·ŷ = ||x̂ - ŷ||² / 2 (sıralama aynı)
+      manhattan   : p=1 Minkowski
+    Düşük boyutta cKDTree, yüksek boyutta distances.pairwise ile bloklu kaba kuvvet.
+    Kosinüs sıfır vektörde tanımsızdır; böyle satırlar diğer tüm satırlara 0.5 uzaklıkta görünür.
+    """
+
+    def __init__(self, data, metric="euclidean", cov=None, method="auto", leafsize=LEAF_SIZE):
+        if metric not in METRICS:
+            raise ValueError(f"metric {METRICS} içinden biri olmalı, gelen: {metric}")
+        if method not in ("auto", "tree", "brute"):
+            raise ValueError("method 'auto', 'tree' veya 'brute' olmalı")
+        data = np.atleast_2d(np.asarray(data, dtype=float))
+        self.metric = metric
+        self.n_features = data.shape[1]
+        self.model = None
+        if metric == "mahalanobis":
+            self.model = as_model(np.cov(data, rowvar=False) if cov is None else cov)
+        self.p = 1 if metric == "manhattan" else 2
+        self.data = self._transform(data)
+        if method == "auto":
+            method = "tree" if self.n_features <= TREE_MAX_DIM else "brute"
+        self.method = method
+        self.tree = cKDTree(self.data, leafsize=leafsize) if method == "tree" else None
+
+    def __len__(self):
+        return self.data.shape[0]
+
+    def _transform(self, X):
+        if self.metric == "mahalanobis":
+            return self.model.whiten(X)
+        if self.metric == "cosine":
+            return unit_rows(X)
+        return X
+
+    def _queries(self, X):
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        if X.shape[1] != self.n_features:
+            raise ValueError(f"Öznitelik sayıları uyuşmuyor: {self.n_features} ve {X.shape[1]}")
+        return self._transform(X)
+
+    def _to_metric(self, d):
+        # Dönüştürülmüş uzaydaki Minkowski uzaklığından istenen metriğe
+        return d * d / 2 if self.metric == "cosine" else d
+
+    def _to_space(self, r):
+        return np.sqrt(2 * r) if self.metric == "cosine" else r
+
+    def _brute(self, Q):
+        return pairwise(Q, self.data, "manhattan" if self.p == 1 else "euclidean")
+
+    def query(self, X, k=1, workers=None):
+        """
+        Her sorgu satırı için en yakın k komşu: (uzaklıklar, indeksler), boyut (m, k),
+        artan uzaklık sırasında.
+        """
+        Q = self._queries(X)
+        k = min(k, len(self))
+        if self.tree is not None:
+            d, idx = self.tree.query(Q, k=k, p=self.p, workers=workers or os.cpu_count())
+            d, idx = d.reshape(len(Q), k), idx.reshape(len(Q), k)
+            return self._to_metric(d), idx
+
+        dist = np.empty((len(Q), k))
+        idx = np.empty((len(Q), k), dtype=np.intp)
+        rows = block_rows(len(self))
+        for r in range(0, len(Q), rows):
+            block = self._brute(Q[r:r + rows])
+            part = np.argpartition(block, k - 1, axis=1)[:, :k]
+            part_d = np.take_along_axis(block, part, axis=1)
+            order = np.argsort(part_d, axis=1, kind="stable")
+            idx[r:r + rows] = np.take_along_axis(part, order, axis=1)
+            dist[r:r + rows] = np.take_along_axis(part_d, order, axis=1)
+        return self._to_metric(dist), idx
+
+    def query_radius(self, X, r, workers=None):
+        """Her sorgu satırı için uzaklığı r'yi aşmayan veri indeksleri (sıralı diziler listesi)."""
+        Q = self._queries(X)
+        radius = self._to_space(r)
+        if self.tree is not None:
+            hits = self.tree.query_ball_point(Q, radius, p=self.p, workers=workers or os.cpu_count(),
+                                              return_sorted=True)
+            return [np.asarray(h, dtype=np.intp) for h in hits]
+
+        result = []
+        rows = block_rows(len(self))
+        for s in range(0, len(Q), rows):
+            block = self._brute(Q[s:s + rows])
+            result.extend(np.flatnonzero(row <= radius) for row in block)
+        return result
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from scipy.spatial import distance
+
+from covariance import CovarianceModel
+from distances import pairwise
+
+SCALES = np.array([1.0, 1.0, 1e6])
+
+
+@pytest.fixture
+def data():
+    # Yaklaşık birim varyanslı sütunlar; SCALES ile çarpılınca varyans oranı 1e12 olur
+    return np.random.default_rng(0).standard_normal((200, 3))
+
+def reference(X, cov):
+    return distance.cdist(X, X, "mahalanobis", VI=np.linalg.inv(cov))
+
+@pytest.mark.parametrize("fallback", ["pinv", "ridge"])
+def test_column_scales_do_not_change_factorization(data, fallback):
+    # Tam ranklı veri sütun ölçeklerinden bağımsız olarak Cholesky ile ayrışmalı
+    X = data * SCALES
+    model = CovarianceModel.from_data(X, fallback)
+    assert model.kind == "cholesky"
+    assert model.rank == X.shape[1]
+    res = pairwise(X[:50], metric="mahalanobis", cov=model)
+    np.testing.assert_allclose(res, reference(X[:50], model.cov), rtol=1e-8, atol=1e-8)
+    # Mahalanobis ölçekten bağımsızdır: ölçeklenmemiş veriyle aynı uzaklıklar
+    np.testing.assert_allclose(res, pairwise(data[:50], metric="mahalanobis", cov=np.cov(data, rowvar=False)),
+                               rtol=1e-8, atol=1e-8)
+
+def test_singular_scaled_covariance_uses_pinv(data):
+    # Üçüncü sütun ilk ikisinin bileşimi: ölçekler ne olursa olsun rank 2
+    X = np.column_stack([data[:, :2], data[:, 0] - 2 * data[:, 1]]) * SCALES
+    model = CovarianceModel.from_data(X)
+    assert model.kind == "pinv"
+    assert model.rank == 2
+    np.testing.assert_allclose(model.cov @ model.precision @ model.cov, model.cov, rtol=1e-6, atol=1e-6 * 1e12)
+
+def test_add_matches_refit_with_scaled_columns(data):
+    X = data * SCALES
+    model = CovarianceModel.from_data(X[:150])
+    model.add(X[150:152])
+    refit = CovarianceModel.from_data(X[:152])
+    np.testing.assert_allclose(model.factor @ model.factor.T, refit.cov, rtol=1e-9)